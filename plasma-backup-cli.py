@@ -8,87 +8,474 @@ import sys
 import os
 import json
 import argparse
+import functools
+import threading
+import time
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, wait
 
 # Import the backup worker from the main script
 sys.path.insert(0, os.path.dirname(__file__))
 
 # We'll create a simplified version that doesn't require PyQt6
+import errno
+import fnmatch
 import shutil
+import stat
 import subprocess
+import tarfile
 
-def safe_copytree(src, dst, ignore_errors=True):
+# Optional io_uring copy backend (pip install pyuring), needs Linux 5.15+
+try:
+    import pyuring
+except ImportError:
+    pyuring = None
+
+def _kernel_at_least(major, minor):
+    """Check the running kernel release against major.minor"""
+    try:
+        release = tuple(int(x) for x in os.uname().release.split('.')[:2])
+    except ValueError:
+        return False
+    return release >= (major, minor)
+
+if pyuring is not None and not _kernel_at_least(5, 15):
+    pyuring = None
+
+# Optional faster JSON (pip install orjson); both helpers work on bytes
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = lambda obj: orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _loads = json.loads
+    _dumps = lambda obj: json.dumps(obj, indent=2).encode()
+
+# Optional compressed archives for --archive (pip install zstandard)
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Regenerable caches and lock files inside Firefox/Thunderbird profiles
+EXCLUDE_NAMES = frozenset({
+    "Cache2", "cache2", "startupCache", "shader-cache", "OfflineCache",
+    "thumbnails", "Crash Reports", "safebrowsing", "lock", ".parentlock",
+})
+# SQLite -wal/-shm sidecars are kept on purpose: a -wal can hold writes
+# that were not checkpointed into the database yet
+EXCLUDE_SUFFIXES = (".old",)
+
+# rsync pipelines metadata far better than a Python walk on NAS shares
+_RSYNC = shutil.which("rsync")
+
+# Upper bound per copy_file_range/sendfile call; the loop runs until EOF
+_COPY_CHUNK = 1 << 30
+
+# Shared pool for per-file copies, so many small files keep the NAS busy
+_COPY_POOL = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4))
+
+def _kernel_copy(src_fd, dst_fd):
+    """
+    Copy src_fd to dst_fd entirely inside the kernel. Raises OSError if
+    fewer bytes than the file's size arrived, so the caller can redo the
+    copy another way.
+    """
+    size = os.fstat(src_fd).st_size
+    copied = 0
+    if hasattr(os, 'copy_file_range'):
+        try:
+            while True:
+                n = os.copy_file_range(src_fd, dst_fd, _COPY_CHUNK)
+                if n == 0:
+                    break
+                copied += n
+            if copied >= size:
+                return
+            # Some filesystems report EOF early (or right away) instead of
+            # failing; sendfile continues from the current offsets
+        except OSError as e:
+            # Cross-device or unsupported: sendfile continues from the
+            # current offsets, so a partial copy is picked up where it stopped
+            if e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP):
+                raise
+    while True:
+        n = os.sendfile(dst_fd, src_fd, None, _COPY_CHUNK)
+        if n == 0:
+            break
+        copied += n
+    if copied < size:
+        raise OSError(errno.EIO, "short in-kernel copy")
+
+def _fast_copyfile(src, dst):
+    """
+    Copy file contents without bouncing them through a userspace buffer.
+    Uses io_uring when pyuring is installed, otherwise copy_file_range
+    (a reflink on Btrfs/XFS), then sendfile, and falls back to
+    shutil.copyfile if the kernel refuses all of them.
+    """
+    if pyuring is not None:
+        try:
+            pyuring.copy(str(src), str(dst), mode="auto")
+            return
+        except OSError:
+            pass  # UringError is an OSError - use the syscall path instead
+    
+    src_fd = os.open(src, os.O_RDONLY)
+    try:
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            _kernel_copy(src_fd, dst_fd)
+            return
+        except OSError:
+            pass
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+    
+    shutil.copyfile(src, dst)
+
+def _same_mtime(prev_ns, src_ns):
+    """
+    Compare the previous copy's mtime with the source's. Exact, unless the
+    copy has no sub-second part - a NAS share with whole-second timestamps
+    truncated it - in which case whole seconds are compared.
+    """
+    if prev_ns == src_ns:
+        return True
+    return prev_ns % 1_000_000_000 == 0 and prev_ns // 1_000_000_000 == src_ns // 1_000_000_000
+
+def _copy_or_link(src, dst, prev_dst=None):
+    """
+    Hardlink dst to prev_dst (the same file in the previous snapshot) when
+    size and mtime are unchanged, otherwise copy src. Copies get src's mtime
+    so the next incremental run can recognise them.
+    """
+    st = os.stat(src)
+    
+    if prev_dst is not None:
+        try:
+            prev_st = os.stat(prev_dst)
+            if prev_st.st_size == st.st_size and _same_mtime(prev_st.st_mtime_ns, st.st_mtime_ns):
+                os.link(prev_dst, dst)
+                return
+        except OSError:
+            pass  # Missing in the previous snapshot, or no hardlinks here
+    
+    _fast_copyfile(src, dst)
+    try:
+        os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+    except OSError:
+        pass  # Best effort - only costs a re-copy next time
+
+def _rsync_copytree(src, dst, link_dest=None, exclude=None):
+    """
+    Mirror src into dst with rsync. Symlinks are skipped (see _plan_links)
+    and no permissions or ownership are set, matching what CIFS/NFS shares
+    accept. link_dest
+    hardlinks files unchanged since a previous backup; exclude works as
+    for safe_copytree.
+    Returns False if rsync failed and the caller should copy by itself.
+    """
+    cmd = [_RSYNC, "-a", "--no-perms", "--no-owner", "--no-group", "--no-links",
+           "--inplace", "--info=stats0"]
+    if link_dest is not None and os.path.isdir(link_dest):
+        cmd.append(f"--link-dest={os.path.abspath(link_dest)}")
+    if exclude:
+        cmd += [f"--exclude={name}" for name in sorted(exclude)]
+        cmd += [f"--exclude=*{suffix}" for suffix in EXCLUDE_SUFFIXES]
+    cmd += [f"{src}/", f"{dst}/"]
+    
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True)
+    except OSError:
+        return False
+    # 23/24 mean some files were unreadable or vanished during the run,
+    # the same entries safe_copytree would skip
+    return result.returncode in (0, 23, 24)
+
+def _archive_tree(src, archive_path):
+    """
+    Stream src into a single zstd-compressed tar file. One sequential write
+    replaces a create per file on the NAS; zstd compresses on all cores.
+    """
+    compressor = zstandard.ZstdCompressor(level=3, threads=-1)
+    try:
+        with open(archive_path, 'wb') as fout, \
+                compressor.stream_writer(fout) as writer, \
+                tarfile.open(fileobj=writer, mode='w|') as tar:
+            _archive_walk(tar, str(src), '.')
+    except Exception:
+        # A truncated archive would only make the restore fail later
+        try:
+            os.unlink(archive_path)
+        except OSError:
+            pass
+        raise
+
+def _archive_walk(tar, path, arcname):
+    """
+    Add the entries under path to tar one by one, skipping unreadable ones.
+    Symlinks are treated as in _plan_walk: file links are stored as their
+    content, directory and broken links are skipped.
+    """
+    try:
+        it = os.scandir(path)
+    except OSError:
+        return
+    
+    with it:
+        for entry in it:
+            name = arcname + '/' + entry.name
+            if entry.is_symlink():
+                real_path = _file_link_target(entry.path)
+                if real_path is not None:
+                    _archive_file(tar, real_path, name)
+                continue
+            
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+                if is_dir:
+                    # Only a header is written, and only once lstat succeeded
+                    tar.add(entry.path, arcname=name, recursive=False)
+            except OSError:
+                continue
+            
+            if is_dir:
+                _archive_walk(tar, entry.path, name)
+            elif entry.is_file(follow_symlinks=False):
+                _archive_file(tar, entry.path, name)
+
+class _SizedReader:
+    """
+    Read exactly size bytes from f for a tar member, padding with zeros if
+    the file shrank after its header was sized (e.g. a checkpointed -wal).
+    """
+    
+    def __init__(self, f, size):
+        self._f = f
+        self._left = size
+    
+    def read(self, n=-1):
+        if n < 0 or n > self._left:
+            n = self._left
+        data = self._f.read(n)
+        if len(data) < n:
+            data += bytes(n - len(data))
+        self._left -= n
+        return data
+
+def _archive_file(tar, path, name):
+    """
+    Add one file to tar under name. A file that can't be opened is skipped;
+    once its header is written, read errors propagate, since the member
+    can no longer be completed and the rest of the stream would be corrupt.
+    """
+    try:
+        f = open(path, 'rb')
+    except OSError:
+        return
+    with f:
+        try:
+            tarinfo = tar.gettarinfo(arcname=name, fileobj=f)
+        except OSError:
+            return
+        tar.addfile(tarinfo, _SizedReader(f, tarinfo.size))
+
+def safe_copytree(src, dst, ignore_errors=True, prev_root=None, exclude=None):
     """
     Safely copy directory tree, handling symlinks and permission errors.
     This is NAS-friendly and won't fail on problematic symlinks.
     Uses manual recursive copy to have full control over error handling.
+    The tree is planned first, then all directories are created and the
+    file copies run on the shared copy pool; this returns once every file
+    of the tree has been copied.
+    prev_root is dst's counterpart in the previous snapshot, if any;
+    unchanged files are hardlinked to it instead of copied.
+    exclude is a set of entry names to skip (e.g. EXCLUDE_NAMES); when
+    given, names ending in EXCLUDE_SUFFIXES are skipped as well.
+    """
+    if prev_root is not None:
+        prev_root = str(prev_root)
+    _safe_copytree_str(str(src), str(dst), ignore_errors, prev_root, exclude)
+
+def _safe_copytree_str(src, dst, ignore_errors=True, prev_root=None, exclude=None,
+                       made=None):
+    """safe_copytree for callers that already hold plain str paths"""
+    dirs, files = _plan_copytree(src, dst, ignore_errors, prev_root, exclude)
+    _run_copy_plan(dirs, files, ignore_errors, made)
+
+def _run_copy_plan(dirs, files, ignore_errors=True, made=None):
+    """
+    Execute a plan from _plan_copytree: mkdir every dir, then copy files.
+    made is an optional set of directories already created during this
+    run; they are skipped and new ones are added to it.
     """
-    src = Path(src)
-    dst = Path(dst)
+    # Create the whole destination tree first (the walk lists parents before
+    # children), leaving a homogeneous batch of file copies for the pool
+    for d in dirs:
+        if made is not None and d in made:
+            continue
+        try:
+            os.makedirs(d, exist_ok=True)
+        except OSError:
+            if not ignore_errors:
+                raise
+            continue
+        if made is not None:
+            made.add(d)
     
+    pending = [_COPY_POOL.submit(_copy_or_link, *job) for job in files]
+    wait(pending)
+    if not ignore_errors:
+        for future in pending:
+            future.result()
+
+def _plan_copytree(src, dst, ignore_errors=True, prev=None, exclude=None):
+    """
+    Walk src with os.scandir without touching the destination.
+    Returns (dirs_to_mkdir, files_to_copy) where files_to_copy holds
+    (src_file, dst_file, prev_file) tuples for _copy_or_link.
+    """
+    dirs = []
+    files = []
+    _plan_walk(src, dst, ignore_errors, prev, exclude, dirs, files)
+    return dirs, files
+
+def _file_link_target(path):
+    """
+    Resolve the symlink at path to the file it points to, or None.
+    Directory symlinks are not followed, to avoid loops and the permission
+    errors they often cause on NAS shares; broken links are skipped.
+    """
     try:
-        dst.mkdir(parents=True, exist_ok=True)
-    except Exception as e:
-        if not ignore_errors:
-            raise
+        real_path = os.path.realpath(path, strict=True)
+    except (OSError, PermissionError, RuntimeError):
+        return None
+    return real_path if os.path.isfile(real_path) else None
+
+def _plan_links(src, dst, prev, exclude, files):
+    """
+    Collect the file symlinks under src as _plan_walk would copy them.
+    rsync runs with --no-links, so they are copied as content afterwards.
+    """
+    try:
+        it = os.scandir(src)
+    except OSError:
         return
     
+    with it:
+        for entry in it:
+            if exclude and (entry.name in exclude or entry.name.endswith(EXCLUDE_SUFFIXES)):
+                continue
+            
+            dst_item = os.path.join(dst, entry.name)
+            prev_item = os.path.join(prev, entry.name) if prev is not None else None
+            
+            try:
+                if entry.is_symlink():
+                    real_path = _file_link_target(entry.path)
+                    if real_path is not None:
+                        files.append((real_path, dst_item, prev_item))
+                elif entry.is_dir(follow_symlinks=False):
+                    _plan_links(entry.path, dst_item, prev_item, exclude, files)
+            except OSError:
+                continue
+
+def _plan_walk(src, dst, ignore_errors, prev, exclude, dirs, files):
+    """Recursive part of _plan_copytree"""
+    dirs.append(dst)
+    
     try:
-        items = list(src.iterdir())
+        it = os.scandir(src)
     except (OSError, PermissionError) as e:
         if not ignore_errors:
             raise
         return
     
-    for item in items:
-        dst_item = dst / item.name
-        
-        try:
-            # Check if it's a symlink
-            if item.is_symlink():
-                # Try to resolve the symlink
-                try:
-                    real_path = item.resolve(strict=True)
-                    
+    with it:
+        for entry in it:
+            if exclude and (entry.name in exclude or entry.name.endswith(EXCLUDE_SUFFIXES)):
+                continue
+            
+            dst_item = os.path.join(dst, entry.name)
+            prev_item = os.path.join(prev, entry.name) if prev is not None else None
+            
+            try:
+                # Check if it's a symlink
+                if entry.is_symlink():
                     # If it points to a file, copy the file content
-                    if real_path.is_file():
-                        shutil.copyfile(str(real_path), str(dst_item))
-                    # If it points to a directory, skip it to avoid loops and issues
-                    # Directory symlinks on NAS often cause permission errors
-                    elif real_path.is_dir():
-                        # Skip directory symlinks
-                        continue
-                except (OSError, PermissionError, RuntimeError):
-                    # Broken symlink or permission error - skip it
-                    continue
-                    
-            elif item.is_file():
-                # Regular file - copy it
-                try:
-                    shutil.copyfile(str(item), str(dst_item))
-                except (OSError, PermissionError) as e:
-                    if not ignore_errors:
-                        raise
-                    # Skip files that can't be copied
-                    continue
+                    real_path = _file_link_target(entry.path)
+                    if real_path is not None:
+                        files.append((real_path, dst_item, prev_item))
+                        
+                elif entry.is_file(follow_symlinks=False):
+                    # Regular file - copy it; failures surface from the
+                    # future and are skipped unless ignore_errors is off
+                    files.append((entry.path, dst_item, prev_item))
+                        
+                elif entry.is_dir(follow_symlinks=False):
+                    # Regular directory - recurse into it
+                    _plan_walk(entry.path, dst_item, ignore_errors, prev_item, exclude, dirs, files)
                     
-            elif item.is_dir():
-                # Regular directory - recurse into it
-                safe_copytree(str(item), str(dst_item), ignore_errors=ignore_errors)
-                
-        except (OSError, PermissionError) as e:
-            if not ignore_errors:
-                raise
-            # Skip items that cause errors
-            continue
+            except (OSError, PermissionError) as e:
+                if not ignore_errors:
+                    raise
+                # Skip items that cause errors
+                continue
+
+# Neither changes while the process runs, so each is looked up only once
+@functools.lru_cache(maxsize=1)
+def _kde_version():
+    """Get KDE Plasma version"""
+    try:
+        result = subprocess.run(['plasmashell', '--version'], 
+                              capture_output=True, text=True)
+        return result.stdout.strip()
+    except:
+        return "Unknown"
+
+@functools.lru_cache(maxsize=1)
+def _fedora_version():
+    """Get Fedora version"""
+    try:
+        with open('/etc/fedora-release', 'r') as f:
+            return f.read().strip()
+    except:
+        return "Unknown"
 
 class BackupManagerCLI:
+    # XDG_<TOKEN>_DIR entries of user-dirs.dirs -> backup directory name
+    _XDG_MAP = {
+        'DOCUMENTS': 'Documents',
+        'PICTURES': 'Pictures',
+        'VIDEOS': 'Videos',
+        'MUSIC': 'Music',
+        'DOWNLOAD': 'Downloads',
+    }
+    
     def __init__(self):
         self.home = str(Path.home())
         self.hostname = os.uname().nodename
         self.default_backup_base = str(Path.home() / "NAS" / "Backups" / "Fedora" / "KDE")
         
+        # Resolved once, reused by every backup step
+        self._home_path = Path(self.home)
+        self._user = os.getenv('USER')
+        self._firefox_src = self._home_path / ".mozilla/firefox"
+        self._thunderbird_src = self._home_path / ".thunderbird"
+        self._user_dirs_file = self._home_path / ".config/user-dirs.dirs"
+        self._log_lock = threading.Lock()
+        self._log_sec = None
+        self._log_stamp = ""
+        self._prev_backup = None
+        self._archive = False
+        self._kde_future = None
+        self._fedora_future = None
+        self._dirs_made = set()
+        
         # Try to load custom backup path from config
         self.load_backup_config()
         
@@ -96,7 +483,7 @@ class BackupManagerCLI:
     
     def load_backup_config(self):
         """Load custom backup path from config file if it exists"""
-        config_file = Path.home() / ".config" / "plasma-backup-manager" / "config.json"
+        config_file = self._home_path / ".config" / "plasma-backup-manager" / "config.json"
         if config_file.exists():
             try:
                 with open(config_file, 'r') as f:
@@ -108,8 +495,14 @@ class BackupManagerCLI:
     
     def log(self, message):
         """Print log message with timestamp"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        print(f"[{timestamp}] {message}")
+        now = int(time.time())
+        # Components run in parallel, keep lines from interleaving
+        with self._log_lock:
+            # Only reformat the timestamp when the second changes
+            if now != self._log_sec:
+                self._log_sec = now
+                self._log_stamp = time.strftime("%H:%M:%S", time.localtime(now))
+            print(f"[{self._log_stamp}] {message}")
     
     def backup(self, config=None, backup_path=None):
         """Perform backup"""
@@ -123,31 +516,47 @@ class BackupManagerCLI:
                 'firefox': True,
                 'thunderbird': True,
                 'user_dirs': True,
+                'archive': False,
             }
         
         try:
+            self._archive = config.get('archive', False)
+            self._dirs_made = set()
+            
+            # Unchanged files are hardlinked against the latest complete backup
+            self._prev_backup = self.latest_backup(backup_path)
+            
             # Create backup directory structure
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_dir = Path(backup_path) / timestamp
             backup_dir.mkdir(parents=True, exist_ok=True)
             
             self.log(f"Creating backup in: {backup_dir}")
+            if self._prev_backup:
+                self.log(f"Incremental against: {self._prev_backup}")
             
-            # Backup components
-            if config['kde_settings']:
-                self.backup_kde_settings(backup_dir)
-            
-            if config['app_configs']:
-                self.backup_app_configs(backup_dir)
+            # Backup components concurrently - they are I/O bound and each
+            # writes into its own subdirectory of backup_dir
+            components = [
+                ('kde_settings', self.backup_kde_settings),
+                ('app_configs', self.backup_app_configs),
+                ('firefox', self.backup_firefox),
+                ('thunderbird', self.backup_thunderbird),
+                ('user_dirs', self.backup_user_directories),
+            ]
+            tasks = [(name, fn) for name, fn in components if config[name]]
             
-            if config['firefox']:
-                self.backup_firefox(backup_dir)
-            
-            if config['thunderbird']:
-                self.backup_thunderbird(backup_dir)
+            with ThreadPoolExecutor(max_workers=7) as executor:
+                # Version probes fork plasmashell; overlap them with the copies
+                self._kde_future = executor.submit(self.get_kde_version)
+                self._fedora_future = executor.submit(self.get_fedora_version)
+                
+                futures = [executor.submit(fn, backup_dir) for _, fn in tasks]
+                wait(futures)
             
-            if config['user_dirs']:
-                self.backup_user_directories(backup_dir)
+            # Re-raise the first component failure, as the serial loop did
+            for future in futures:
+                future.result()
             
             # Save metadata
             self.save_metadata(backup_dir, timestamp, config)
@@ -159,12 +568,48 @@ class BackupManagerCLI:
             self.log(f"✗ Backup failed: {str(e)}")
             return False, str(e)
     
+    def latest_backup(self, backup_path):
+        """Path of the most recent complete backup under backup_path, or None"""
+        if not os.path.isdir(backup_path):
+            return None
+        backups = self.list_backups(backup_path)
+        return backups[0]['path'] if backups else None
+    
+    def _prev_path(self, backup_dir, dst):
+        """Counterpart of dst (inside backup_dir) in the previous backup"""
+        if self._prev_backup is None:
+            return None
+        return os.path.join(self._prev_backup, os.path.relpath(dst, backup_dir))
+    
+    def _ensure_dir(self, path):
+        """makedirs once per path for the whole backup run"""
+        path = str(path)
+        if path in self._dirs_made:
+            return
+        os.makedirs(path, exist_ok=True)
+        self._dirs_made.add(path)
+    
+    def _copy_tree(self, src, dst, backup_dir, exclude=None):
+        """Copy a large tree with rsync when available, else safe_copytree"""
+        prev = self._prev_path(backup_dir, dst)
+        if _RSYNC:
+            if _rsync_copytree(src, dst, prev, exclude):
+                # Symlinks to files are backed up as content, as without rsync
+                links = []
+                _plan_links(str(src), str(dst), prev, exclude, links)
+                _run_copy_plan([], links)
+                return
+            # Drop partial output - writing over files rsync hardlinked
+            # would change them in the previous backup too
+            shutil.rmtree(dst, ignore_errors=True)
+        _safe_copytree_str(str(src), str(dst), True, prev, exclude, self._dirs_made)
+    
     def backup_kde_settings(self, backup_dir):
         """Backup KDE Plasma settings"""
         self.log("Backing up KDE Plasma settings...")
         
         kde_dir = backup_dir / "kde"
-        kde_dir.mkdir(exist_ok=True)
+        self._ensure_dir(kde_dir)
         
         config_paths = [
             ".config/plasma*",
@@ -183,8 +628,8 @@ class BackupManagerCLI:
             ".local/share/applications",
         ]
         
-        for pattern in config_paths:
-            self.copy_pattern(self.home, kde_dir, pattern)
+        self.copy_patterns(self.home, kde_dir, config_paths,
+                           self._prev_path(backup_dir, kde_dir))
         
         self.log("  ✓ KDE settings backed up")
     
@@ -193,7 +638,7 @@ class BackupManagerCLI:
         self.log("Backing up application configurations...")
         
         config_dir = backup_dir / "configs"
-        config_dir.mkdir(exist_ok=True)
+        self._ensure_dir(config_dir)
         
         specific_apps = [
             ".config/Code",
@@ -208,15 +653,23 @@ class BackupManagerCLI:
             ".ssh/config",
         ]
         
+        config_dir = str(config_dir)
         for app_path in specific_apps:
-            src = Path(self.home) / app_path
-            if src.exists():
-                dst = config_dir / app_path
-                dst.parent.mkdir(parents=True, exist_ok=True)
-                if src.is_dir():
-                    safe_copytree(str(src), str(dst), ignore_errors=True)
-                else:
-                    shutil.copyfile(src, dst)
+            src = os.path.join(self.home, app_path)
+            # One stat answers both "exists" and "is it a directory".
+            # Follows symlinks so dotfiles managed via links are still copied.
+            try:
+                st = os.stat(src)
+            except OSError:
+                continue
+            
+            dst = os.path.join(config_dir, app_path)
+            self._ensure_dir(os.path.dirname(dst))
+            prev = self._prev_path(backup_dir, dst)
+            if stat.S_ISDIR(st.st_mode):
+                _safe_copytree_str(src, dst, True, prev, made=self._dirs_made)
+            elif stat.S_ISREG(st.st_mode):
+                _copy_or_link(src, dst, prev)
         
         self.log("  ✓ Application configs backed up")
     
@@ -224,10 +677,10 @@ class BackupManagerCLI:
         """Backup Firefox profiles"""
         self.log("Backing up Firefox profiles...")
         
-        firefox_src = Path(self.home) / ".mozilla/firefox"
+        firefox_src = self._firefox_src
         if firefox_src.exists():
             firefox_dst = backup_dir / "firefox"
-            safe_copytree(str(firefox_src), str(firefox_dst), ignore_errors=True)
+            self._copy_tree(firefox_src, firefox_dst, backup_dir, EXCLUDE_NAMES)
             self.log("  ✓ Firefox profiles backed up")
         else:
             self.log("  ⊘ Firefox profiles not found, skipping")
@@ -236,10 +689,10 @@ class BackupManagerCLI:
         """Backup Thunderbird profiles"""
         self.log("Backing up Thunderbird profiles...")
         
-        thunderbird_src = Path(self.home) / ".thunderbird"
+        thunderbird_src = self._thunderbird_src
         if thunderbird_src.exists():
             thunderbird_dst = backup_dir / "thunderbird"
-            safe_copytree(str(thunderbird_src), str(thunderbird_dst), ignore_errors=True)
+            self._copy_tree(thunderbird_src, thunderbird_dst, backup_dir, EXCLUDE_NAMES)
             self.log("  ✓ Thunderbird profiles backed up")
         else:
             self.log("  ⊘ Thunderbird profiles not found, skipping")
@@ -250,14 +703,22 @@ class BackupManagerCLI:
         
         user_dirs = self.get_xdg_user_dirs()
         data_dir = backup_dir / "user_data"
-        data_dir.mkdir(exist_ok=True)
+        self._ensure_dir(data_dir)
+        
+        archive = self._archive
+        if archive and zstandard is None:
+            self.log("  ⚠ python-zstandard is not installed, copying files instead of archiving")
+            archive = False
         
         for dir_type, dir_path in user_dirs.items():
             if dir_path and Path(dir_path).exists():
                 self.log(f"  Backing up {dir_type}...")
                 dst = data_dir / dir_type
                 try:
-                    safe_copytree(str(dir_path), str(dst), ignore_errors=True)
+                    if archive:
+                        _archive_tree(dir_path, data_dir / f"{dir_type}.tar.zst")
+                    else:
+                        self._copy_tree(dir_path, dst, backup_dir)
                     self.log(f"  ✓ {dir_type} backed up")
                 except Exception as e:
                     self.log(f"  ⚠ Could not backup {dir_type}: {str(e)}")
@@ -265,7 +726,7 @@ class BackupManagerCLI:
     def get_xdg_user_dirs(self):
         """Get XDG user directories"""
         dirs = {}
-        config_file = Path(self.home) / ".config/user-dirs.dirs"
+        config_file = self._user_dirs_file
         
         if config_file.exists():
             with open(config_file, 'r') as f:
@@ -273,92 +734,104 @@ class BackupManagerCLI:
                     line = line.strip()
                     if line.startswith('XDG_') and '=' in line:
                         key, value = line.split('=', 1)
-                        value = value.strip('"').replace('$HOME', self.home)
-                        
-                        if 'DOCUMENTS' in key:
-                            dirs['Documents'] = value
-                        elif 'PICTURES' in key:
-                            dirs['Pictures'] = value
-                        elif 'VIDEOS' in key:
-                            dirs['Videos'] = value
-                        elif 'MUSIC' in key:
-                            dirs['Music'] = value
-                        elif 'DOWNLOAD' in key:
-                            dirs['Downloads'] = value
+                        # XDG_PICTURES_DIR -> PICTURES
+                        name = self._XDG_MAP.get(key[4:].removesuffix('_DIR'))
+                        if name:
+                            dirs[name] = value.strip('"').replace('$HOME', self.home)
         else:
-            dirs = {
-                'Documents': os.path.join(self.home, 'Documents'),
-                'Pictures': os.path.join(self.home, 'Pictures'),
-                'Videos': os.path.join(self.home, 'Videos'),
-                'Music': os.path.join(self.home, 'Music'),
-                'Downloads': os.path.join(self.home, 'Downloads'),
-            }
+            dirs = {name: os.path.join(self.home, name) for name in self._XDG_MAP.values()}
         
         return dirs
     
-    def copy_pattern(self, src_base, dst_base, pattern):
-        """Copy files matching a pattern"""
-        src_path = Path(src_base)
+    def copy_pattern(self, src_base, dst_base, pattern, prev_base=None):
+        """Copy files matching a pattern (prev_base: dst_base in the previous backup)"""
+        self.copy_patterns(src_base, dst_base, [pattern], prev_base)
+    
+    def copy_patterns(self, src_base, dst_base, patterns, prev_base=None):
+        """
+        Copy everything matching patterns, relative paths under src_base with
+        an optional glob in the last component. Patterns sharing a parent
+        directory are matched against a single os.scandir of it, and all
+        matches are copied as one plan.
+        """
+        src_base = str(src_base)
+        dst_base = str(dst_base)
+        
+        by_parent = {}
+        for pattern in patterns:
+            parent, _, leaf = pattern.rpartition('/')
+            by_parent.setdefault(parent, []).append(leaf)
         
-        if '*' in pattern:
-            parts = pattern.split('/')
-            current = src_path
+        dirs = []
+        files = []
+        for parent, leaves in by_parent.items():
+            try:
+                with os.scandir(os.path.join(src_base, parent)) as it:
+                    entries = {e.name: e for e in it}
+            except OSError:
+                continue
             
-            for part in parts[:-1]:
-                current = current / part
+            # dict keeps pattern order and drops names matched twice
+            # (e.g. kdeglobals by both "kde*" and "kdeglobals")
+            names = {}
+            for leaf in leaves:
+                if '*' in leaf:
+                    names.update(dict.fromkeys(fnmatch.filter(entries, leaf)))
+                elif leaf in entries:
+                    names[leaf] = None
             
-            if current.exists():
-                for item in current.glob(parts[-1]):
-                    rel_path = item.relative_to(src_path)
-                    dst = Path(dst_base) / rel_path
-                    dst.parent.mkdir(parents=True, exist_ok=True)
-                    
-                    if item.is_dir():
-                        safe_copytree(str(item), str(dst), ignore_errors=True)
-                    else:
-                        shutil.copyfile(item, dst)
-        else:
-            src = src_path / pattern
-            if src.exists():
-                dst = Path(dst_base) / pattern
-                dst.parent.mkdir(parents=True, exist_ok=True)
+            for name in names:
+                entry = entries[name]
+                rel_path = parent + '/' + name if parent else name
+                dst = os.path.join(dst_base, rel_path)
+                prev = os.path.join(prev_base, rel_path) if prev_base else None
                 
-                if src.is_dir():
-                    safe_copytree(str(src), str(dst), ignore_errors=True)
-                else:
-                    shutil.copyfile(src, dst)
+                # is_dir() follows symlinks like Path.glob matches did, and is
+                # served from the dirent for everything that is not a link
+                try:
+                    if entry.is_dir():
+                        sub_dirs, sub_files = _plan_copytree(entry.path, dst, True, prev)
+                        dirs += sub_dirs
+                        files += sub_files
+                    elif entry.is_file():
+                        dirs.append(os.path.dirname(dst))
+                        files.append((entry.path, dst, prev))
+                except OSError:
+                    continue
+        
+        _run_copy_plan(dirs, files, made=self._dirs_made)
     
     def save_metadata(self, backup_dir, timestamp, config):
         """Save backup metadata"""
         metadata = {
             'timestamp': timestamp,
             'hostname': self.hostname,
-            'user': os.getenv('USER'),
+            'user': self._user,
             'config': config,
-            'kde_version': self.get_kde_version(),
-            'fedora_version': self.get_fedora_version(),
+            'kde_version': self._probe_result(self._kde_future, self.get_kde_version),
+            'fedora_version': self._probe_result(self._fedora_future, self.get_fedora_version),
         }
         
         metadata_file = backup_dir / "backup_metadata.json"
-        with open(metadata_file, 'w') as f:
-            json.dump(metadata, f, indent=2)
+        with open(metadata_file, 'wb') as f:
+            f.write(_dumps(metadata))
     
-    def get_kde_version(self):
-        """Get KDE Plasma version"""
+    def _probe_result(self, future, probe):
+        """Result of a version probe started by backup(), or run it now"""
+        if future is None:
+            return probe()
         try:
-            result = subprocess.run(['plasmashell', '--version'], 
-                                  capture_output=True, text=True)
-            return result.stdout.strip()
-        except:
+            return future.result(timeout=5)
+        except Exception:
             return "Unknown"
     
+    def get_kde_version(self):
+        """Get KDE Plasma version"""
+        return _kde_version()
+    
     def get_fedora_version(self):
         """Get Fedora version"""
-        try:
-            with open('/etc/fedora-release', 'r') as f:
-                return f.read().strip()
-        except:
-            return "Unknown"
+        return _fedora_version()
     
     def list_backups(self, backup_base=None):
         """List available backups"""
@@ -377,8 +850,8 @@ class BackupManagerCLI:
                 metadata_file = item / "backup_metadata.json"
                 if metadata_file.exists():
                     try:
-                        with open(metadata_file, 'r') as f:
-                            metadata = json.load(f)
+                        with open(metadata_file, 'rb') as f:
+                            metadata = _loads(f.read())
                         
                         backups.append({
                             'path': str(item),
@@ -413,6 +886,9 @@ Examples:
   # Backup only KDE settings
   %(prog)s backup --kde-only
   
+  # Store user directories as compressed archives
+  %(prog)s backup --archive
+  
   # List available backups
   %(prog)s list
   
@@ -434,6 +910,9 @@ Examples:
                               help='Skip Thunderbird backup')
     backup_parser.add_argument('--no-user-dirs', action='store_true',
                               help='Skip user directories backup')
+    backup_parser.add_argument('--archive', action='store_true',
+                              help='Store user directories as compressed .tar.zst archives '
+                                   '(requires python-zstandard)')
     
     # List command
     list_parser = subparsers.add_parser('list', help='List available backups')
@@ -453,6 +932,7 @@ Examples:
             'firefox': not args.kde_only and not args.no_firefox,
             'thunderbird': not args.kde_only and not args.no_thunderbird,
             'user_dirs': not args.kde_only and not args.no_user_dirs,
+            'archive': args.archive,
         }
         
         success, result = manager.backup(config, args.path)
@@ -473,7 +953,7 @@ Examples:
     
     elif args.command == 'info':
         print(f"Hostname:       {manager.hostname}")
-        print(f"User:           {os.getenv('USER')}")
+        print(f"User:           {manager._user}")
         print(f"Home:           {manager.home}")
         print(f"KDE Version:    {manager.get_kde_version()}")
         print(f"OS:             {manager.get_fedora_version()}")
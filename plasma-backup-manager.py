@@ -7,93 +7,662 @@ A comprehensive backup and restore solution for KDE Plasma settings and user dat
 import sys
 import os
 import json
+import operator
+import errno
+import fcntl
+import fnmatch
+import functools
+import re
+import resource
 import shutil
+import stat
 import subprocess
+import tarfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QLabel, QListWidget, QTextEdit, QTabWidget,
+    QPushButton, QLabel, QListView, QTextEdit, QTabWidget,
     QFileDialog, QMessageBox, QProgressBar, QLineEdit, QCheckBox,
     QGroupBox, QRadioButton, QButtonGroup
 )
 from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer
-from PyQt6.QtGui import QIcon, QFont
+from PyQt6.QtGui import QIcon, QFont, QTextCursor, QStandardItem, QStandardItemModel
 
-def safe_copytree(src, dst, ignore_errors=True, progress_callback=None):
+# Optional faster JSON (pip install orjson); both helpers work on bytes
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = lambda obj: orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    _dumps_line = lambda obj: orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+except ImportError:
+    _loads = json.loads
+    _dumps = lambda obj: json.dumps(obj, indent=2).encode()
+    _dumps_line = lambda obj: json.dumps(obj, separators=(',', ':')).encode() + b'\n'
+
+# Optional compressed backups (pip install zstandard)
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# One copy buffer per thread instead of a fresh allocation per file.
+# Backup tasks run concurrently, so the buffer cannot be process-wide.
+# The buffer is allocated on a thread's first copy and lives as long as
+# the thread; _fast_copy only ever hands out slices of it and never keeps
+# one past its return, so nothing else may hold a reference to it.
+_COPY_BUF_SIZE = 1024 * 1024
+_copy_local = threading.local()
+
+# Files larger than one buffer go through sendfile instead of being
+# dragged through userspace
+_SENDFILE_MIN = _COPY_BUF_SIZE
+
+# Regenerable cache folders left out of profiles and application configs
+# by default; editable in the GUI
+DEFAULT_EXCLUDES = (
+    'cache2', 'startupCache', 'OfflineCache', 'thumbnails', 'shader-cache',
+    'Cache', 'Code Cache', 'GPUCache', '.cache',
+)
+
+# Symlinked files bigger than this are not pulled into the backup
+MAX_SYMLINK_SIZE = 100 * 1024 * 1024
+
+def _copy_buffer():
+    """Return this thread's reusable copy buffer"""
+    view = getattr(_copy_local, 'view', None)
+    if view is None:
+        view = _copy_local.view = memoryview(bytearray(_COPY_BUF_SIZE))
+    return view
+
+def _safe_stat(path):
+    """os.stat that returns None instead of raising for missing/unreadable paths"""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+# XDG_<TOKEN>_DIR entries of user-dirs.dirs -> backup directory name
+_XDG_RE = re.compile(r'^XDG_(\w+)_DIR="(.+)"$', re.M)
+_XDG_MAP = {
+    'DOCUMENTS': 'Documents',
+    'PICTURES': 'Pictures',
+    'VIDEOS': 'Videos',
+    'MUSIC': 'Music',
+    'DOWNLOAD': 'Downloads',
+}
+
+@functools.lru_cache(maxsize=1)
+def _xdg_user_dirs(home):
+    """Get XDG user directories (handles localized names), parsed once per process"""
+    try:
+        with open(os.path.join(home, ".config/user-dirs.dirs"), 'r') as f:
+            text = f.read()
+    except OSError:
+        # Fallback to default names
+        return {name: os.path.join(home, name) for name in _XDG_MAP.values()}
+    
+    return {_XDG_MAP[key]: value.replace('$HOME', home)
+            for key, value in _XDG_RE.findall(text) if key in _XDG_MAP}
+
+# Neither changes while the process runs, so each is looked up only once
+@functools.lru_cache(maxsize=1)
+def _kde_version():
+    """Get KDE Plasma version"""
+    try:
+        result = subprocess.run(['plasmashell', '--version'], 
+                              capture_output=True, text=True)
+        return result.stdout.strip()
+    except:
+        return "Unknown"
+
+@functools.lru_cache(maxsize=1)
+def _fedora_version():
+    """Get Fedora version"""
+    try:
+        with open('/etc/fedora-release', 'r') as f:
+            return f.read().strip()
+    except:
+        return "Unknown"
+
+def _read_os_release():
+    """Get the OS name from /etc/os-release PRETTY_NAME, else fedora-release"""
+    try:
+        with open('/etc/os-release', 'r') as f:
+            for line in f:
+                if line.startswith('PRETTY_NAME='):
+                    return line.split('=', 1)[1].strip().strip('"\'')
+    except OSError:
+        pass
+    return _fedora_version()
+
+def _backup_sort_key(timestamp):
+    """Parse a backup timestamp (YYYYmmdd_HHMMSS); unparseable names sort last"""
+    try:
+        return datetime.strptime(timestamp, "%Y%m%d_%H%M%S")
+    except (TypeError, ValueError):
+        return datetime.min
+
+def _parallel_workers():
+    """Number of concurrent backup tasks (PBM_PARALLEL lowers it for HDD/encrypted targets)"""
+    try:
+        return max(1, min(4, int(os.environ.get('PBM_PARALLEL', 4))))
+    except ValueError:
+        return 4
+
+# FICLONE ioctl: CoW clone on btrfs/XFS, metadata-only
+_FICLONE = getattr(fcntl, 'FICLONE', 0x40049409)
+_NOT_SUPPORTED = (errno.EOPNOTSUPP, errno.ENOTTY, errno.EXDEV, errno.EINVAL, errno.ENOSYS, errno.EBADF)
+
+# (src st_dev, dst st_dev) pairs where a fast path already failed; one
+# EOPNOTSUPP disables that attempt for the rest of the run
+_no_clone = set()
+_no_copy_range = set()
+_no_sendfile = set()
+
+_FADVISE = hasattr(os, 'posix_fadvise')
+
+def _clone(src_fd, dst_fd, devs):
+    """Try a reflink clone, True on success"""
+    if devs in _no_clone:
+        return False
+    try:
+        fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+        return True
+    except OSError as e:
+        if e.errno in _NOT_SUPPORTED:
+            _no_clone.add(devs)
+        return False
+
+def _copy_range(src_fd, dst_fd, size, devs):
+    """Try an in-kernel copy (server-side on NFSv4.2), True on success"""
+    if devs in _no_copy_range or not hasattr(os, 'copy_file_range'):
+        return False
+    left = size
+    try:
+        while left > 0:
+            n = os.copy_file_range(src_fd, dst_fd, left)
+            if not n:
+                break
+            left -= n
+        if left <= 0:
+            return True
+        # Some filesystems report EOF early (or right away) instead of
+        # failing; unless the file really shrank, don't trust them again
+        if os.fstat(src_fd).st_size >= size:
+            _no_copy_range.add(devs)
+    except OSError as e:
+        if e.errno in _NOT_SUPPORTED:
+            _no_copy_range.add(devs)
+    # Start the fallback from a clean destination
+    os.lseek(src_fd, 0, os.SEEK_SET)
+    os.lseek(dst_fd, 0, os.SEEK_SET)
+    os.ftruncate(dst_fd, 0)
+    return False
+
+def _sendfile(src_fd, dst_fd, size, devs):
+    """Copy with sendfile at explicit offsets, returning bytes copied or None"""
+    offset = 0
+    try:
+        while offset < size:
+            sent = os.sendfile(dst_fd, src_fd, offset, size - offset)
+            if not sent:
+                break
+            offset += sent
+        return offset
+    except OSError as e:
+        if e.errno not in _NOT_SUPPORTED:
+            raise
+        _no_sendfile.add(devs)
+        # The source offset was never moved; restart the destination
+        os.lseek(dst_fd, 0, os.SEEK_SET)
+        os.ftruncate(dst_fd, 0)
+        return None
+
+# Reading a source file never needs to update its access time. O_NOATIME
+# is only allowed on files we own, so _open_src retries without it.
+_SRC_FLAGS = os.O_RDONLY | os.O_CLOEXEC | getattr(os, 'O_NOATIME', 0)
+_DST_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC
+
+def _open_src(path):
+    """Open a file for copying from, skipping the atime update when allowed"""
+    try:
+        return os.open(path, _SRC_FLAGS)
+    except PermissionError:
+        if not _SRC_FLAGS & getattr(os, 'O_NOATIME', 0):
+            raise
+        return os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+
+def _raise_nofile_limit():
+    """Lift the soft open-file limit so parallel copies cannot run out of fds"""
+    try:
+        soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+        target = 65536 if hard == resource.RLIM_INFINITY else min(hard, 65536)
+        if soft != resource.RLIM_INFINITY and soft < target:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (target, hard))
+    except (ValueError, OSError):
+        pass
+
+def _open_new(dst):
+    """
+    Create dst for writing without ever opening an existing file: it may be
+    a hardlink into the previous backup, so it is replaced instead.
+    """
+    try:
+        return os.open(dst, _DST_FLAGS | os.O_EXCL, 0o666)
+    except FileExistsError:
+        os.unlink(dst)
+        return os.open(dst, _DST_FLAGS | os.O_EXCL, 0o666)
+
+def _fast_copy(src, dst, exclusive=False):
+    """
+    Copy file contents: reflink clone, then copy_file_range, then sendfile
+    for large files or a plain read/write loop through this thread's 1 MiB
+    buffer. No permission or metadata calls, the most CIFS-compatible
+    method. exclusive replaces an existing dst instead of writing into it.
+    Returns bytes copied.
+    """
+    src_fd = _open_src(src)
+    try:
+        dst_fd = _open_new(dst) if exclusive else os.open(dst, _DST_FLAGS, 0o666)
+        try:
+            if _FADVISE:
+                os.posix_fadvise(src_fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            copied = _copy_fds(src_fd, dst_fd)
+            if _FADVISE:
+                # Backup data is never reread; keep the desktop's working
+                # set in the page cache instead (dirty dst pages stay until
+                # writeback, no fsync is forced)
+                os.posix_fadvise(src_fd, 0, 0, os.POSIX_FADV_DONTNEED)
+                os.posix_fadvise(dst_fd, 0, 0, os.POSIX_FADV_DONTNEED)
+            return copied
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+
+def _copy_fds(src_fd, dst_fd):
+    """Copy src_fd to dst_fd with the fastest tier that works, returning bytes copied"""
+    src_st = os.fstat(src_fd)
+    devs = (src_st.st_dev, os.fstat(dst_fd).st_dev)
+    if _clone(src_fd, dst_fd, devs):
+        return src_st.st_size
+    if _copy_range(src_fd, dst_fd, src_st.st_size, devs):
+        return src_st.st_size
+    
+    if src_st.st_size > _SENDFILE_MIN and devs not in _no_sendfile:
+        copied = _sendfile(src_fd, dst_fd, src_st.st_size, devs)
+        if copied is not None:
+            return copied
+    
+    buf = _copy_buffer()
+    copied = 0
+    while True:
+        n = os.readv(src_fd, [buf])
+        if not n:
+            break
+        copied += n
+        view = buf[:n]
+        while view:
+            view = view[os.write(dst_fd, view):]
+    return copied
+
+def _tree_link(path, src_root):
+    """
+    Link text, relative to the link's directory, for a symlink to a file
+    inside src_root; None for any other symlink. Such a target is copied
+    in its own right, so the copy only needs the link itself.
+    """
+    try:
+        target = os.path.normpath(os.path.join(os.path.dirname(path), os.readlink(path)))
+    except OSError:
+        return None
+    if not src_root or not target.startswith(src_root + os.sep) or not os.path.isfile(target):
+        return None
+    return os.path.relpath(target, os.path.dirname(path))
+
+def _place_link(link, path, dst, copy_file=_fast_copy):
+    """
+    Recreate a symlink found by _tree_link at dst. Where the destination
+    can't hold symlinks (e.g. CIFS shares), the file is copied instead.
+    Returns the bytes copied.
+    """
+    try:
+        os.symlink(link, dst)
+        return 0
+    except OSError:
+        return copy_file(path, dst)
+
+def _symlink_skip_reason(path, src_root):
+    """
+    Decide with a single stat whether to copy a symlink (other than one
+    _tree_link handles) as a file. Returns None to copy it, or why it is
+    skipped.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return "broken symlink"
+    if stat.S_ISDIR(st.st_mode):
+        return "directory symlink"
+    if not stat.S_ISREG(st.st_mode):
+        return "special file symlink"
+    if st.st_size > MAX_SYMLINK_SIZE:
+        return f"symlink to a {st.st_size / (1024 * 1024):.0f} MB file"
+    return None
+
+def safe_copytree(src, dst, ignore_errors=True, progress_callback=None, src_root=None,
+                  exclude=None, copy_file=_fast_copy):
     """
     Safely copy directory tree, handling symlinks and permission errors.
     This is NAS-friendly (CIFS/SMB compatible) and won't fail on problematic symlinks.
     Uses manual file read/write to avoid ALL permission/metadata operations.
+    Walks with os.scandir so type checks are answered from the dirent.
+    Symlinks to files inside src_root (the top-level src) are recreated
+    as relative links; others are copied as files only when they point at
+    a regular file of at most MAX_SYMLINK_SIZE.
+    Directories whose name is in exclude are not copied. Files go through
+    copy_file(src, dst), which returns the bytes it wrote.
+    Returns (files, bytes) copied so callers need not re-walk the result.
     """
-    src = Path(src)
-    dst = Path(dst)
+    src = str(src)
+    dst = str(dst)
+    if src_root is None:
+        src_root = os.path.normpath(os.path.abspath(src))
+    files = 0
+    total_bytes = 0
     
     try:
-        dst.mkdir(parents=True, exist_ok=True)
+        os.makedirs(dst, exist_ok=True)
     except Exception as e:
         if not ignore_errors:
             raise
-        return
+        return files, total_bytes
     
     try:
-        items = list(src.iterdir())
+        it = os.scandir(src)
     except (OSError, PermissionError) as e:
         if not ignore_errors:
             raise
-        return
+        return files, total_bytes
     
-    for item in items:
-        dst_item = dst / item.name
-        
-        try:
-            # Check if it's a symlink
-            if item.is_symlink():
-                # Try to resolve the symlink
-                try:
-                    real_path = item.resolve(strict=True)
+    with it:
+        for entry in it:
+            dst_item = os.path.join(dst, entry.name)
+            
+            try:
+                # Check if it's a symlink
+                if entry.is_symlink():
+                    link = _tree_link(entry.path, src_root)
+                    skip = None if link is not None else _symlink_skip_reason(entry.path, src_root)
+                    if skip:
+                        if progress_callback:
+                            progress_callback(f"  ⊘ Skipped {skip}: {entry.name}")
+                        continue
                     
-                    # If it points to a file, copy the file content
-                    if real_path.is_file():
-                        # Manual read/write - most CIFS-compatible method
-                        with open(str(real_path), 'rb') as src_file:
-                            with open(str(dst_item), 'wb') as dst_file:
-                                dst_file.write(src_file.read())
-                    # If it points to a directory, skip it
-                    elif real_path.is_dir():
+                    # It points to a file, copy the file content
+                    try:
+                        if link is not None:
+                            total_bytes += _place_link(link, entry.path, dst_item, copy_file)
+                        else:
+                            # Manual read/write - most CIFS-compatible method
+                            total_bytes += copy_file(entry.path, dst_item)
+                        files += 1
+                    except (OSError, PermissionError):
                         if progress_callback:
-                            progress_callback(f"  ⊘ Skipped directory symlink: {item.name}")
+                            progress_callback(f"  ⊘ Skipped broken symlink: {entry.name}")
+                        continue
+                        
+                elif entry.is_file(follow_symlinks=False):
+                    # Regular file - manual read/write for CIFS compatibility
+                    try:
+                        total_bytes += copy_file(entry.path, dst_item)
+                        files += 1
+                    except (OSError, PermissionError) as e:
+                        if not ignore_errors:
+                            raise
+                        if progress_callback:
+                            progress_callback(f"  ⚠ Could not copy file: {entry.name}")
+                        continue
+                        
+                elif entry.is_dir(follow_symlinks=False):
+                    if exclude and entry.name in exclude:
+                        if progress_callback:
+                            progress_callback(f"  ⊘ Excluded {entry.name}: {entry.path}")
                         continue
-                except (OSError, PermissionError, RuntimeError):
-                    if progress_callback:
-                        progress_callback(f"  ⊘ Skipped broken symlink: {item.name}")
-                    continue
                     
-            elif item.is_file():
-                # Regular file - manual read/write for CIFS compatibility
-                try:
-                    with open(str(item), 'rb') as src_file:
-                        with open(str(dst_item), 'wb') as dst_file:
-                            dst_file.write(src_file.read())
-                except (OSError, PermissionError) as e:
-                    if not ignore_errors:
-                        raise
-                    if progress_callback:
-                        progress_callback(f"  ⚠ Could not copy file: {item.name}")
-                    continue
+                    # Regular directory - recurse into it
+                    sub_files, sub_bytes = safe_copytree(entry.path, dst_item, ignore_errors=ignore_errors,
+                                                         progress_callback=progress_callback, src_root=src_root,
+                                                         exclude=exclude, copy_file=copy_file)
+                    files += sub_files
+                    total_bytes += sub_bytes
                     
-            elif item.is_dir():
-                # Regular directory - recurse into it
-                safe_copytree(str(item), str(dst_item), ignore_errors=ignore_errors, progress_callback=progress_callback)
-                
-        except (OSError, PermissionError) as e:
-            if not ignore_errors:
-                raise
-            if progress_callback:
-                progress_callback(f"  ⚠ Error accessing: {item.name}")
-            continue
+            except (OSError, PermissionError) as e:
+                if not ignore_errors:
+                    raise
+                if progress_callback:
+                    progress_callback(f"  ⚠ Error accessing: {entry.name}")
+                continue
+    
+    return files, total_bytes
+
+_RSYNC = shutil.which("rsync")
+
+def _rsync_tree(src, dst, progress, exclude=None, link_dest=None, links=False):
+    """
+    Copy src into dst with rsync, feeding its errors and warnings to progress.
+    Symlinks are skipped (BackupWorker._finish_rsync_tree handles them
+    afterwards) unless links is set, which restores the links a backup
+    recreated. No permissions or ownership are set, matching what CIFS/NFS
+    shares accept; nothing in dst is ever deleted. exclude works as for
+    safe_copytree; files unchanged in link_dest (dst's counterpart in the
+    previous backup) are hardlinked to it.
+    Returns False if rsync is unavailable or failed and the caller should
+    copy by itself.
+    """
+    if _RSYNC is None:
+        return False
+    
+    # No --info=progress2: it redraws one line with \r, which would reach
+    # the log as a new line per tick
+    cmd = [_RSYNC, "-a", "--no-perms", "--no-owner", "--no-group",
+           "--links" if links else "--no-links", "--inplace"]
+    if exclude:
+        # Trailing slash: match directories only, like safe_copytree
+        cmd += [f"--exclude={name}/" for name in sorted(exclude)]
+    if link_dest is not None and os.path.isdir(link_dest):
+        cmd.append(f"--link-dest={os.path.abspath(link_dest)}")
+    cmd += [f"{src}/", f"{dst}/"]
+    try:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    except OSError:
+        return False
+    
+    with proc:
+        for line in proc.stdout:
+            line = line.strip()
+            if line:
+                progress(f"  {line}")
+    
+    # 23/24 mean some files were unreadable or vanished during the run,
+    # the same entries safe_copytree would skip
+    return proc.returncode in (0, 23, 24)
+
+def _archive_tree(src, archive_path, exclude=None):
+    """
+    Stream src into a single zstd-compressed tar file without staging it
+    on disk or in memory. Symlinks and exclude are treated as in
+    safe_copytree.
+    Returns (files, bytes written).
+    """
+    compressor = zstandard.ZstdCompressor(level=3, threads=-1)
+    try:
+        with open(archive_path, 'wb') as fout, \
+                compressor.stream_writer(fout) as writer, \
+                tarfile.open(fileobj=writer, mode='w|') as tar:
+            files = _archive_walk(tar, str(src), '.', os.path.normpath(os.path.abspath(src)), exclude)
+    except Exception:
+        # A truncated archive would only make the restore fail later
+        try:
+            os.unlink(archive_path)
+        except OSError:
+            pass
+        raise
+    return files, os.path.getsize(archive_path)
+
+def _archive_walk(tar, path, arcname, src_root, exclude):
+    """Add the entries under path to tar one by one, skipping unreadable ones"""
+    files = 0
+    try:
+        it = os.scandir(path)
+    except OSError:
+        return files
+    
+    with it:
+        for entry in it:
+            name = arcname + '/' + entry.name
+            if entry.is_symlink():
+                # Keep links within the tree, store other file symlinks as
+                # their content, skip the rest
+                link = _tree_link(entry.path, src_root)
+                if link is not None:
+                    try:
+                        tarinfo = tar.gettarinfo(entry.path, arcname=name)
+                    except OSError:
+                        continue
+                    tarinfo.linkname = link
+                    tar.addfile(tarinfo)
+                    files += 1
+                elif _symlink_skip_reason(entry.path, src_root) is None:
+                    files += _archive_file(tar, entry.path, name)
+                continue
+            
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+                if is_dir:
+                    if exclude and entry.name in exclude:
+                        continue
+                    # Only a header is written, and only once lstat succeeded
+                    tar.add(entry.path, arcname=name, recursive=False)
+            except OSError:
+                continue
+            
+            if is_dir:
+                files += _archive_walk(tar, entry.path, name, src_root, exclude)
+            elif entry.is_file(follow_symlinks=False):
+                files += _archive_file(tar, entry.path, name)
+    
+    return files
+
+class _SizedReader:
+    """
+    Read exactly size bytes from f for a tar member, padding with zeros if
+    the file shrank after its header was sized (e.g. a checkpointed -wal).
+    """
+    
+    def __init__(self, f, size):
+        self._f = f
+        self._left = size
+    
+    def read(self, n=-1):
+        if n < 0 or n > self._left:
+            n = self._left
+        data = self._f.read(n)
+        if len(data) < n:
+            data += bytes(n - len(data))
+        self._left -= n
+        return data
+
+def _archive_file(tar, path, name):
+    """
+    Add one file to tar under name, returning 1 if it was added. A file that
+    can't be opened is skipped; once its header is written, read errors
+    propagate, since the member can no longer be completed and the rest of
+    the stream would be corrupt.
+    """
+    try:
+        f = open(path, 'rb')
+    except OSError:
+        return 0
+    with f:
+        try:
+            tarinfo = tar.gettarinfo(arcname=name, fileobj=f)
+        except OSError:
+            return 0
+        tar.addfile(tarinfo, _SizedReader(f, tarinfo.size))
+    return 1
+
+def _extract_archive(archive_path, dst):
+    """Unpack a .tar.zst written by _archive_tree into dst"""
+    if zstandard is None:
+        raise RuntimeError("python-zstandard is required to restore compressed backups")
+    
+    os.makedirs(dst, exist_ok=True)
+    with open(archive_path, 'rb') as fin, \
+            zstandard.ZstdDecompressor().stream_reader(fin) as reader, \
+            tarfile.open(fileobj=reader, mode='r|') as tar:
+        if hasattr(tarfile, 'data_filter'):
+            tar.extractall(dst, filter='data')
+        else:
+            tar.extractall(dst)
+
+class _Worker(QThread):
+    """Progress batching and directory caching shared by the worker threads"""
+    
+    # Progress lines are sent to the GUI in batches of this many lines or
+    # after this many seconds, whichever comes first
+    EMIT_BATCH = 32
+    EMIT_INTERVAL = 0.1
+    
+    def __init__(self):
+        super().__init__()
+        self.home = str(Path.home())
+        self._mkdir_cache = set()
+        self._emit_lock = threading.Lock()
+        self._pending = []
+        self._last_flush = time.monotonic()
+        
+        # Lines queued before a long quiet copy still reach the GUI; the
+        # timer lives in the GUI thread, the worker's run() has no event loop
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setInterval(int(self.EMIT_INTERVAL * 1000))
+        self._flush_timer.timeout.connect(self._flush_progress)
+        self.started.connect(self._flush_timer.start)
+        self.finished.connect(lambda *args: self._flush_timer.stop())
+    
+    def _emit(self, message):
+        """Queue a progress line; safe to call from several threads"""
+        with self._emit_lock:
+            self._pending.append(message)
+            now = time.monotonic()
+            if len(self._pending) >= self.EMIT_BATCH or now - self._last_flush > self.EMIT_INTERVAL:
+                self._flush_locked(now)
+    
+    def _flush_progress(self):
+        """Send any queued progress lines"""
+        with self._emit_lock:
+            self._flush_locked(time.monotonic())
+    
+    def _flush_locked(self, now):
+        if self._pending:
+            self.progress.emit('\n'.join(self._pending))
+            self._pending.clear()
+        self._last_flush = now
+    
+    def _ensure_dir(self, path):
+        """makedirs once per destination directory for the whole run"""
+        path = str(path)
+        if path in self._mkdir_cache:
+            return
+        os.makedirs(path, exist_ok=True)
+        self._mkdir_cache.add(path)
 
-class BackupWorker(QThread):
+
+class BackupWorker(_Worker):
     """Worker thread for backup operations"""
     progress = pyqtSignal(str)
     finished = pyqtSignal(bool, str)
@@ -102,73 +671,246 @@ class BackupWorker(QThread):
         super().__init__()
         self.config = config
         self.backup_path = backup_path
-        self.home = str(Path.home())
+        self.workers = _parallel_workers()
+        self.excludes = frozenset(config['excludes'])
+        self._missing = set()
+        self._claimed = set()
+        self._claim_lock = threading.Lock()
+        self._sizes = {}
+        self._sizes_lock = threading.Lock()
+        self._backup_dir = None
+        self._prev_dir = None
+        self._prev = {}
+        self._manifest = None
+        self._manifest_lock = threading.Lock()
+        self._linked = 0
+        
+    def _account(self, component, files, nbytes):
+        """Add copied files/bytes to a component's running totals"""
+        with self._sizes_lock:
+            prev_files, prev_bytes = self._sizes.get(component, (0, 0))
+            self._sizes[component] = (prev_files + files, prev_bytes + nbytes)
+    
+    def _stat(self, path):
+        """Stat a source path once, remembering paths that do not exist"""
+        if path in self._missing:
+            return None
+        st = _safe_stat(path)
+        if st is None:
+            self._missing.add(path)
+        return st
+    
+    def _claim(self, path):
+        """
+        True the first time a source path is matched. Patterns run
+        concurrently and can overlap (e.g. kdeglobals by both "kde*" and
+        "kdeglobals"), so each match is copied once.
+        """
+        with self._claim_lock:
+            if path in self._claimed:
+                return False
+            self._claimed.add(path)
+            return True
+    
+    def _load_previous(self, backup_dir):
+        """Find the newest earlier backup with a manifest and index it by source path"""
+        try:
+            with os.scandir(self.backup_path) as it:
+                names = sorted((entry.name for entry in it
+                                if entry.name < backup_dir.name and entry.is_dir()), reverse=True)
+        except OSError:
+            return
+        
+        for name in names:
+            prev_dir = os.path.join(self.backup_path, name)
+            try:
+                with open(os.path.join(prev_dir, "manifest.jsonl"), 'rb') as f:
+                    prev = {}
+                    for line in f:
+                        record = _loads(line)
+                        prev[record['p']] = (record['s'], record['m'], record['t'])
+            except (OSError, ValueError, KeyError):
+                continue
+            self._prev_dir = prev_dir
+            self._prev = prev
+            self._emit(f"Incremental against: {prev_dir}")
+            return
+    
+    def _copy_file(self, src, dst):
+        """
+        Copy one file into the backup and record it in the manifest.
+        Files whose size and mtime match the previous backup's manifest are
+        hardlinked to the copy there instead; returns the file's size.
+        """
+        src = str(src)
+        dst = str(dst)
+        st = os.stat(src)
+        target = os.path.relpath(dst, self._backup_dir)
+        
+        prev = self._prev.get(src)
+        linked = False
+        if prev is not None and prev[0] == st.st_size and prev[1] == st.st_mtime_ns:
+            try:
+                os.link(os.path.join(self._prev_dir, prev[2]), dst)
+                linked = True
+            except OSError:
+                # Cross-device or unsupported: copy instead, replacing
+                # whatever is already at dst
+                pass
+        
+        copied = st.st_size if linked else _fast_copy(src, dst, exclusive=True)
+        self._record(src, st, target, linked)
+        return copied
+    
+    def _record(self, src, st, target, linked):
+        """Add one backed-up file to the manifest"""
+        line = _dumps_line({"p": src, "s": st.st_size, "m": st.st_mtime_ns, "t": target})
+        with self._manifest_lock:
+            self._manifest.write(line)
+            self._linked += linked
+    
+    def _copy_tree(self, src, dst, exclude=None):
+        """Copy a large tree with rsync when available, otherwise safe_copytree"""
+        link_dest = None
+        if self._prev_dir is not None:
+            link_dest = os.path.join(self._prev_dir, os.path.relpath(dst, self._backup_dir))
+        if not _rsync_tree(src, dst, self._emit, exclude, link_dest):
+            if link_dest is not None:
+                # Drop partial output - writing over files rsync hardlinked
+                # would change them in the previous backup too
+                shutil.rmtree(dst, ignore_errors=True)
+            return safe_copytree(str(src), str(dst), ignore_errors=True, progress_callback=self._emit,
+                                 exclude=exclude, copy_file=self._copy_file)
+        files, total_bytes = self._finish_rsync_tree(str(src), str(dst), os.path.normpath(os.path.abspath(src)), exclude)
+        self._emit(f"  rsync: {files} files, {total_bytes / (1024 * 1024):.1f} MB in {os.path.basename(dst)}")
+        return files, total_bytes
+    
+    def _finish_rsync_tree(self, src, dst, src_root, exclude):
+        """
+        Bring a tree rsync copied in line with the safe_copytree path: copy
+        the symlinks rsync skipped by safe_copytree's rules and add rsync's
+        files to the manifest, counting linked files at full size as
+        _copy_file does (rsync's --stats leave hardlinked files out).
+        Returns (files, bytes) in the backup.
+        """
+        files = 0
+        total_bytes = 0
+        try:
+            it = os.scandir(src)
+        except OSError:
+            return files, total_bytes
         
+        with it:
+            for entry in it:
+                dst_item = os.path.join(dst, entry.name)
+                try:
+                    if entry.is_symlink():
+                        link = _tree_link(entry.path, src_root)
+                        if link is not None:
+                            total_bytes += _place_link(link, entry.path, dst_item, self._copy_file)
+                            files += 1
+                            continue
+                        skip = _symlink_skip_reason(entry.path, src_root)
+                        if skip:
+                            self._emit(f"  ⊘ Skipped {skip}: {entry.name}")
+                            continue
+                        total_bytes += self._copy_file(entry.path, dst_item)
+                        files += 1
+                    elif entry.is_file(follow_symlinks=False):
+                        # rsync kept the mtime; a file it could not read is missing
+                        try:
+                            st = os.lstat(dst_item)
+                        except FileNotFoundError:
+                            continue
+                        self._record(entry.path, st, os.path.relpath(dst_item, self._backup_dir),
+                                     st.st_nlink > 1)
+                        total_bytes += st.st_size
+                        files += 1
+                    elif entry.is_dir(follow_symlinks=False):
+                        if exclude and entry.name in exclude:
+                            continue
+                        sub_files, sub_bytes = self._finish_rsync_tree(entry.path, dst_item, src_root, exclude)
+                        files += sub_files
+                        total_bytes += sub_bytes
+                except OSError:
+                    self._emit(f"  ⚠ Error accessing: {entry.name}")
+        
+        return files, total_bytes
+    
+    def _run_task(self, task, backup_dir):
+        """Run one backup component and separate its output"""
+        task(backup_dir)
+        self._emit("")
+    
     def run(self):
+        _raise_nofile_limit()
         try:
             # Create backup directory structure
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_dir = Path(self.backup_path) / timestamp
-            backup_dir.mkdir(parents=True, exist_ok=True)
-            
-            self.progress.emit(f"Creating backup in: {backup_dir}")
-            self.progress.emit("")
+            self._ensure_dir(backup_dir)
+            # Everything above the snapshot exists now as well
+            self._mkdir_cache.update(str(parent) for parent in backup_dir.parents)
             
-            # Backup KDE Plasma settings
-            if self.config['kde_settings']:
-                self.backup_kde_settings(backup_dir)
-                self.progress.emit("")
+            self._emit(f"Creating backup in: {backup_dir}")
+            self._emit("")
             
-            # Backup application configs
-            if self.config['app_configs']:
-                self.backup_app_configs(backup_dir)
-                self.progress.emit("")
+            self.compress = self.config['compress']
+            if self.compress and zstandard is None:
+                self._emit("⚠ python-zstandard is not installed, copying files uncompressed")
+                self._emit("")
+                self.compress = False
             
-            # Backup Firefox profiles
-            if self.config['firefox']:
-                self.backup_firefox(backup_dir)
-                self.progress.emit("")
+            # Unchanged files are hardlinked to the previous backup
+            self._backup_dir = str(backup_dir)
+            self._load_previous(backup_dir)
             
-            # Backup Thunderbird profiles
-            if self.config['thunderbird']:
-                self.backup_thunderbird(backup_dir)
-                self.progress.emit("")
-            
-            # Backup user directories
-            if self.config['user_dirs']:
-                self.backup_user_directories(backup_dir)
-                self.progress.emit("")
+            # Components write to separate subdirectories, so run them concurrently
+            tasks = [
+                (self.config['kde_settings'], self.backup_kde_settings),
+                (self.config['app_configs'], self.backup_app_configs),
+                (self.config['firefox'], self.backup_firefox),
+                (self.config['thunderbird'], self.backup_thunderbird),
+                (self.config['user_dirs'], self.backup_user_directories),
+            ]
+            with open(backup_dir / "manifest.jsonl", 'wb') as self._manifest:
+                with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                    futures = [executor.submit(self._run_task, task, backup_dir)
+                               for enabled, task in tasks if enabled]
+                for future in futures:
+                    future.result()
             
             # Save backup metadata
             self.save_metadata(backup_dir, timestamp)
             
             # Generate summary
-            self.progress.emit("=== Backup Summary ===")
-            for subdir in backup_dir.iterdir():
-                if subdir.is_dir():
-                    file_count = sum(1 for _ in subdir.rglob('*') if _.is_file())
-                    size = sum(f.stat().st_size for f in subdir.rglob('*') if f.is_file())
-                    size_mb = size / (1024 * 1024)
-                    self.progress.emit(f"  {subdir.name}: {file_count} files, {size_mb:.1f} MB")
+            self._emit("=== Backup Summary ===")
+            for component, (file_count, size) in self._sizes.items():
+                size_mb = size / (1024 * 1024)
+                self._emit(f"  {component}: {file_count} files, {size_mb:.1f} MB")
+            total_size = sum(b for _, b in self._sizes.values())
             
-            total_size = sum(f.stat().st_size for f in backup_dir.rglob('*') if f.is_file())
             total_mb = total_size / (1024 * 1024)
-            self.progress.emit(f"  Total: {total_mb:.1f} MB")
-            self.progress.emit("")
+            if self._linked:
+                self._emit(f"  Unchanged (hardlinked): {self._linked} files")
+            self._emit(f"  Total: {total_mb:.1f} MB")
+            self._emit("")
             
+            self._flush_progress()
             self.finished.emit(True, f"Backup completed successfully!\n\nLocation: {backup_dir}\nSize: {total_mb:.1f} MB")
             
         except Exception as e:
             import traceback
             error_msg = f"Backup failed: {str(e)}\n\nDetails:\n{traceback.format_exc()}"
+            self._flush_progress()
             self.finished.emit(False, error_msg)
     
     def backup_kde_settings(self, backup_dir):
         """Backup KDE Plasma settings including plasmoids"""
-        self.progress.emit("Backing up KDE Plasma settings...")
+        self._emit("Backing up KDE Plasma settings...")
         
         kde_dir = backup_dir / "kde"
-        kde_dir.mkdir(exist_ok=True)
+        self._ensure_dir(kde_dir)
         
         # KDE configuration files
         config_paths = [
@@ -188,17 +930,18 @@ class BackupWorker(QThread):
             ".local/share/applications",
         ]
         
-        for pattern in config_paths:
-            self.copy_pattern(self.home, kde_dir, pattern)
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            results = list(executor.map(lambda p: self.copy_pattern(self.home, kde_dir, p), config_paths))
+        self._account("kde", sum(f for f, _ in results), sum(b for _, b in results))
         
-        self.progress.emit("KDE settings backed up")
+        self._emit("KDE settings backed up")
     
     def backup_app_configs(self, backup_dir):
         """Backup various application configurations"""
-        self.progress.emit("Backing up application configurations...")
+        self._emit("Backing up application configurations...")
         
         config_dir = backup_dir / "configs"
-        config_dir.mkdir(exist_ok=True)
+        self._ensure_dir(config_dir)
         
         # Specific applications to backup
         specific_apps = [
@@ -214,153 +957,160 @@ class BackupWorker(QThread):
             ".ssh/config",
         ]
         
+        # One stat per candidate answers both "exists" and "is it a directory"
+        candidates = [(app_path, st) for app_path, st in
+                      ((p, self._stat(os.path.join(self.home, p))) for p in specific_apps)
+                      if st is not None]
+        
         backed_up_count = 0
-        for app_path in specific_apps:
-            src = Path(self.home) / app_path
-            if src.exists():
-                dst = config_dir / app_path
-                dst.parent.mkdir(parents=True, exist_ok=True)
-                try:
-                    if src.is_dir():
-                        safe_copytree(str(src), str(dst), ignore_errors=True, progress_callback=self.progress.emit)
-                        self.progress.emit(f"  ✓ Backed up {app_path}")
-                        backed_up_count += 1
-                    else:
-                        shutil.copyfile(src, dst)
-                        self.progress.emit(f"  ✓ Backed up {app_path}")
-                        backed_up_count += 1
-                except Exception as e:
-                    self.progress.emit(f"  ⚠ Skipped {app_path}: {str(e)}")
+        files = 0
+        total_bytes = 0
+        for app_path, st in candidates:
+            src = os.path.join(self.home, app_path)
+            dst = config_dir / app_path
+            self._ensure_dir(dst.parent)
+            try:
+                if stat.S_ISDIR(st.st_mode):
+                    sub_files, sub_bytes = safe_copytree(src, str(dst), ignore_errors=True, progress_callback=self._emit,
+                                                         exclude=self.excludes, copy_file=self._copy_file)
+                    files += sub_files
+                    total_bytes += sub_bytes
+                    self._emit(f"  ✓ Backed up {app_path}")
+                    backed_up_count += 1
+                elif stat.S_ISREG(st.st_mode):
+                    total_bytes += self._copy_file(src, dst)
+                    files += 1
+                    self._emit(f"  ✓ Backed up {app_path}")
+                    backed_up_count += 1
+            except Exception as e:
+                self._emit(f"  ⚠ Skipped {app_path}: {str(e)}")
+        self._account("configs", files, total_bytes)
         
         if backed_up_count > 0:
-            self.progress.emit(f"Application configs backed up ({backed_up_count} items)")
+            self._emit(f"Application configs backed up ({backed_up_count} items)")
         else:
-            self.progress.emit("No application configs found to backup")
+            self._emit("No application configs found to backup")
     
     def backup_firefox(self, backup_dir):
         """Backup Firefox profiles"""
-        self.progress.emit("Backing up Firefox profiles...")
+        self._emit("Backing up Firefox profiles...")
         
         firefox_src = Path(self.home) / ".mozilla/firefox"
         if firefox_src.exists():
             firefox_dst = backup_dir / "firefox"
             try:
-                safe_copytree(str(firefox_src), str(firefox_dst), ignore_errors=True, progress_callback=self.progress.emit)
-                self.progress.emit("Firefox profiles backed up")
+                if self.compress:
+                    self._account("firefox", *_archive_tree(firefox_src, backup_dir / "firefox.tar.zst", self.excludes))
+                else:
+                    self._account("firefox", *self._copy_tree(firefox_src, firefox_dst, self.excludes))
+                self._emit("Firefox profiles backed up")
             except Exception as e:
-                self.progress.emit(f"Warning: Firefox backup had issues: {str(e)}")
+                self._emit(f"Warning: Firefox backup had issues: {str(e)}")
         else:
-            self.progress.emit("Firefox profiles not found, skipping")
+            self._emit("Firefox profiles not found, skipping")
     
     def backup_thunderbird(self, backup_dir):
         """Backup Thunderbird profiles"""
-        self.progress.emit("Backing up Thunderbird profiles...")
+        self._emit("Backing up Thunderbird profiles...")
         
         thunderbird_src = Path(self.home) / ".thunderbird"
         if thunderbird_src.exists():
             thunderbird_dst = backup_dir / "thunderbird"
             try:
-                safe_copytree(str(thunderbird_src), str(thunderbird_dst), ignore_errors=True, progress_callback=self.progress.emit)
-                self.progress.emit("Thunderbird profiles backed up")
+                if self.compress:
+                    self._account("thunderbird", *_archive_tree(thunderbird_src, backup_dir / "thunderbird.tar.zst", self.excludes))
+                else:
+                    self._account("thunderbird", *self._copy_tree(thunderbird_src, thunderbird_dst, self.excludes))
+                self._emit("Thunderbird profiles backed up")
             except Exception as e:
-                self.progress.emit(f"Warning: Thunderbird backup had issues: {str(e)}")
+                self._emit(f"Warning: Thunderbird backup had issues: {str(e)}")
         else:
-            self.progress.emit("Thunderbird profiles not found, skipping")
+            self._emit("Thunderbird profiles not found, skipping")
     
     def backup_user_directories(self, backup_dir):
         """Backup user directories (Documents, Pictures, Videos)"""
-        self.progress.emit("Backing up user directories...")
+        self._emit("Backing up user directories...")
         
         # Get XDG user directories
-        user_dirs = self.get_xdg_user_dirs()
+        user_dirs = _xdg_user_dirs(self.home)
         
         data_dir = backup_dir / "user_data"
-        data_dir.mkdir(exist_ok=True)
+        self._ensure_dir(data_dir)
         
         for dir_type, dir_path in user_dirs.items():
             if dir_path and Path(dir_path).exists():
-                self.progress.emit(f"Backing up {dir_type}...")
+                self._emit(f"Backing up {dir_type}...")
                 dst = data_dir / dir_type
                 try:
-                    safe_copytree(str(dir_path), str(dst), ignore_errors=True, progress_callback=self.progress.emit)
-                    self.progress.emit(f"{dir_type} backed up")
+                    if self.compress:
+                        self._account("user_data", *_archive_tree(dir_path, data_dir / f"{dir_type}.tar.zst"))
+                    else:
+                        self._account("user_data", *self._copy_tree(dir_path, dst))
+                    self._emit(f"{dir_type} backed up")
                 except Exception as e:
-                    self.progress.emit(f"Warning: Could not backup {dir_type}: {str(e)}")
-    
-    def get_xdg_user_dirs(self):
-        """Get XDG user directories (handles localized names)"""
-        dirs = {}
-        
-        # Try to read from xdg-user-dirs
-        config_file = Path(self.home) / ".config/user-dirs.dirs"
-        if config_file.exists():
-            with open(config_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line.startswith('XDG_') and '=' in line:
-                        key, value = line.split('=', 1)
-                        value = value.strip('"').replace('$HOME', self.home)
-                        
-                        if 'DOCUMENTS' in key:
-                            dirs['Documents'] = value
-                        elif 'PICTURES' in key:
-                            dirs['Pictures'] = value
-                        elif 'VIDEOS' in key:
-                            dirs['Videos'] = value
-                        elif 'MUSIC' in key:
-                            dirs['Music'] = value
-                        elif 'DOWNLOAD' in key:
-                            dirs['Downloads'] = value
-        else:
-            # Fallback to default names
-            dirs = {
-                'Documents': os.path.join(self.home, 'Documents'),
-                'Pictures': os.path.join(self.home, 'Pictures'),
-                'Videos': os.path.join(self.home, 'Videos'),
-                'Music': os.path.join(self.home, 'Music'),
-                'Downloads': os.path.join(self.home, 'Downloads'),
-            }
-        
-        return dirs
+                    self._emit(f"Warning: Could not backup {dir_type}: {str(e)}")
     
     def copy_pattern(self, src_base, dst_base, pattern):
-        """Copy files matching a pattern"""
-        src_path = Path(src_base)
-        
+        """Copy files matching a pattern, returning (files, bytes) copied"""
+        files = 0
+        total_bytes = 0
         # Handle wildcards
         if '*' in pattern:
             parts = pattern.split('/')
-            current = src_path
+            current = os.path.join(src_base, *parts[:-1])
+            if current in self._missing:
+                return files, total_bytes
             
-            for part in parts[:-1]:
-                current = current / part
+            # Match names from a single scandir instead of glob's per-match stats
+            try:
+                with os.scandir(current) as it:
+                    entries = {entry.name: entry for entry in it}
+            except OSError:
+                self._missing.add(current)
+                return files, total_bytes
             
-            if current.exists():
-                for item in current.glob(parts[-1]):
-                    rel_path = item.relative_to(src_path)
-                    dst = Path(dst_base) / rel_path
-                    dst.parent.mkdir(parents=True, exist_ok=True)
-                    
-                    try:
-                        if item.is_dir():
-                            safe_copytree(str(item), str(dst), ignore_errors=True, progress_callback=self.progress.emit)
-                        else:
-                            shutil.copyfile(item, dst)
-                    except Exception as e:
-                        self.progress.emit(f"  ⚠ Skipped {item.name}: {str(e)}")
+            for name in fnmatch.filter(entries, parts[-1]):
+                item = entries[name]
+                if not self._claim(item.path):
+                    continue
+                dst = Path(dst_base, *parts[:-1], name)
+                self._ensure_dir(dst.parent)
+                
+                try:
+                    if item.is_dir():
+                        sub_files, sub_bytes = safe_copytree(item.path, str(dst), ignore_errors=True, progress_callback=self._emit,
+                                                             copy_file=self._copy_file)
+                        files += sub_files
+                        total_bytes += sub_bytes
+                    elif item.is_file():
+                        total_bytes += self._copy_file(item.path, dst)
+                        files += 1
+                    else:
+                        # Opening a FIFO or socket for reading would block
+                        self._emit(f"  ⊘ Skipped special file: {name}")
+                except Exception as e:
+                    self._emit(f"  ⚠ Skipped {name}: {str(e)}")
         else:
-            src = src_path / pattern
-            if src.exists():
+            src = os.path.join(src_base, pattern)
+            st = self._stat(src)
+            if st is not None and self._claim(src):
                 dst = Path(dst_base) / pattern
-                dst.parent.mkdir(parents=True, exist_ok=True)
+                self._ensure_dir(dst.parent)
                 
                 try:
-                    if src.is_dir():
-                        safe_copytree(str(src), str(dst), ignore_errors=True, progress_callback=self.progress.emit)
+                    if stat.S_ISDIR(st.st_mode):
+                        files, total_bytes = safe_copytree(src, str(dst), ignore_errors=True, progress_callback=self._emit,
+                                                           copy_file=self._copy_file)
+                    elif stat.S_ISREG(st.st_mode):
+                        total_bytes = self._copy_file(src, dst)
+                        files = 1
                     else:
-                        shutil.copyfile(src, dst)
+                        # Opening a FIFO or socket for reading would block
+                        self._emit(f"  ⊘ Skipped special file: {pattern}")
                 except Exception as e:
-                    self.progress.emit(f"  ⚠ Skipped {pattern}: {str(e)}")
+                    self._emit(f"  ⚠ Skipped {pattern}: {str(e)}")
+        
+        return files, total_bytes
     
     def save_metadata(self, backup_dir, timestamp):
         """Save backup metadata"""
@@ -369,33 +1119,20 @@ class BackupWorker(QThread):
             'hostname': os.uname().nodename,
             'user': os.getenv('USER'),
             'config': self.config,
-            'kde_version': self.get_kde_version(),
-            'fedora_version': self.get_fedora_version(),
+            'kde_version': _kde_version(),
+            'fedora_version': _fedora_version(),
         }
         
         metadata_file = backup_dir / "backup_metadata.json"
-        with open(metadata_file, 'w') as f:
-            json.dump(metadata, f, indent=2)
-    
-    def get_kde_version(self):
-        """Get KDE Plasma version"""
-        try:
-            result = subprocess.run(['plasmashell', '--version'], 
-                                  capture_output=True, text=True)
-            return result.stdout.strip()
-        except:
-            return "Unknown"
-    
-    def get_fedora_version(self):
-        """Get Fedora version"""
-        try:
-            with open('/etc/fedora-release', 'r') as f:
-                return f.read().strip()
-        except:
-            return "Unknown"
+        metadata_file.write_bytes(_dumps(metadata))
+        
+        # Just what the restore list shows, so listing never reads the full metadata
+        summary = {key: metadata[key] for key in ('timestamp', 'hostname')}
+        summary_file = backup_dir / "summary.json"
+        summary_file.write_bytes(_dumps(summary))
 
 
-class RestoreWorker(QThread):
+class RestoreWorker(_Worker):
     """Worker thread for restore operations"""
     progress = pyqtSignal(str)
     finished = pyqtSignal(bool, str)
@@ -403,19 +1140,40 @@ class RestoreWorker(QThread):
     def __init__(self, backup_path):
         super().__init__()
         self.backup_path = backup_path
-        self.home = str(Path.home())
         
+    def _merge_tree(self, src, dst):
+        """Copy every file under src to the same relative path under dst"""
+        src = str(src)
+        dst = str(dst)
+        for dirpath, dirnames, filenames in os.walk(src):
+            if not filenames:
+                continue
+            dst_dir = os.path.normpath(os.path.join(dst, os.path.relpath(dirpath, src)))
+            self._ensure_dir(dst_dir)
+            for name in filenames:
+                src_item = os.path.join(dirpath, name)
+                dst_item = os.path.join(dst_dir, name)
+                if os.path.islink(src_item):
+                    # A link the backup recreated inside the tree
+                    try:
+                        os.unlink(dst_item)
+                    except FileNotFoundError:
+                        pass
+                    _place_link(os.readlink(src_item), src_item, dst_item)
+                else:
+                    _fast_copy(src_item, dst_item)
+    
     def run(self):
         try:
             backup_dir = Path(self.backup_path)
             
-            self.progress.emit(f"Restoring from: {backup_dir}")
+            self._emit(f"Restoring from: {backup_dir}")
             
             # Load metadata
             metadata = self.load_metadata(backup_dir)
             if metadata:
-                self.progress.emit(f"Backup from: {metadata.get('timestamp', 'Unknown')}")
-                self.progress.emit(f"Hostname: {metadata.get('hostname', 'Unknown')}")
+                self._emit(f"Backup from: {metadata.get('timestamp', 'Unknown')}")
+                self._emit(f"Hostname: {metadata.get('hostname', 'Unknown')}")
             
             # Restore KDE settings
             kde_dir = backup_dir / "kde"
@@ -427,13 +1185,17 @@ class RestoreWorker(QThread):
             if config_dir.exists():
                 self.restore_configs(config_dir)
             
-            # Restore Firefox
+            # Restore Firefox (plain copy or compressed archive)
             firefox_dir = backup_dir / "firefox"
+            if not firefox_dir.exists():
+                firefox_dir = backup_dir / "firefox.tar.zst"
             if firefox_dir.exists():
                 self.restore_firefox(firefox_dir)
             
             # Restore Thunderbird
             thunderbird_dir = backup_dir / "thunderbird"
+            if not thunderbird_dir.exists():
+                thunderbird_dir = backup_dir / "thunderbird.tar.zst"
             if thunderbird_dir.exists():
                 self.restore_thunderbird(thunderbird_dir)
             
@@ -442,83 +1204,85 @@ class RestoreWorker(QThread):
             if data_dir.exists():
                 self.restore_user_data(data_dir)
             
-            self.progress.emit("\n*** Restore completed! ***")
-            self.progress.emit("Please log out and log back in for all changes to take effect.")
+            self._emit("\n*** Restore completed! ***")
+            self._emit("Please log out and log back in for all changes to take effect.")
+            self._flush_progress()
             self.finished.emit(True, "Restore completed successfully!")
             
         except Exception as e:
+            self._flush_progress()
             self.finished.emit(False, f"Restore failed: {str(e)}")
     
     def load_metadata(self, backup_dir):
         """Load backup metadata"""
         metadata_file = backup_dir / "backup_metadata.json"
         if metadata_file.exists():
-            with open(metadata_file, 'r') as f:
-                return json.load(f)
+            return _loads(metadata_file.read_bytes())
         return None
     
     def restore_kde_settings(self, kde_dir):
         """Restore KDE settings"""
-        self.progress.emit("Restoring KDE Plasma settings...")
+        self._emit("Restoring KDE Plasma settings...")
         
         # Copy all KDE files back
-        for item in kde_dir.rglob('*'):
-            if item.is_file():
-                rel_path = item.relative_to(kde_dir)
-                dst = Path(self.home) / rel_path
-                dst.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copyfile(item, dst)
+        self._merge_tree(kde_dir, self.home)
         
         # Restart Plasma
-        self.progress.emit("Restarting Plasma shell...")
+        self._emit("Restarting Plasma shell...")
         try:
             subprocess.run(['kquitapp6', 'plasmashell'], check=False)
             QTimer.singleShot(2000, lambda: subprocess.Popen(['plasmashell']))
         except:
-            self.progress.emit("Note: Could not automatically restart Plasma")
+            self._emit("Note: Could not automatically restart Plasma")
     
     def restore_configs(self, config_dir):
         """Restore application configs"""
-        self.progress.emit("Restoring application configurations...")
+        self._emit("Restoring application configurations...")
         
-        for item in config_dir.rglob('*'):
-            if item.is_file():
-                rel_path = item.relative_to(config_dir)
-                dst = Path(self.home) / rel_path
-                dst.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copyfile(item, dst)
+        self._merge_tree(config_dir, self.home)
     
     def restore_firefox(self, firefox_dir):
         """Restore Firefox profiles"""
-        self.progress.emit("Restoring Firefox profiles...")
+        self._emit("Restoring Firefox profiles...")
         
         dst = Path(self.home) / ".mozilla/firefox"
-        dst.parent.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(dst.parent)
         
         if dst.exists():
             shutil.rmtree(dst)
-        shutil.copytree(firefox_dir, dst, symlinks=True)
+        if firefox_dir.name.endswith('.tar.zst'):
+            _extract_archive(firefox_dir, dst)
+        else:
+            shutil.copytree(firefox_dir, dst, symlinks=True)
     
     def restore_thunderbird(self, thunderbird_dir):
         """Restore Thunderbird profiles"""
-        self.progress.emit("Restoring Thunderbird profiles...")
+        self._emit("Restoring Thunderbird profiles...")
         
         dst = Path(self.home) / ".thunderbird"
-        dst.parent.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(dst.parent)
         
         if dst.exists():
             shutil.rmtree(dst)
-        shutil.copytree(thunderbird_dir, dst, symlinks=True)
+        if thunderbird_dir.name.endswith('.tar.zst'):
+            _extract_archive(thunderbird_dir, dst)
+        else:
+            shutil.copytree(thunderbird_dir, dst, symlinks=True)
     
     def restore_user_data(self, data_dir):
         """Restore user directories"""
-        self.progress.emit("Restoring user directories...")
+        self._emit("Restoring user directories...")
         
         # Get current XDG directories
-        user_dirs = self.get_xdg_user_dirs()
+        user_dirs = _xdg_user_dirs(self.home)
         
         for dir_type in data_dir.iterdir():
-            if dir_type.is_dir():
+            if dir_type.name.endswith('.tar.zst'):
+                dir_name = dir_type.name.removesuffix('.tar.zst')
+                dst = Path(user_dirs.get(dir_name, Path(self.home) / dir_name))
+                self._emit(f"Restoring {dir_name} to {dst}...")
+                _extract_archive(dir_type, dst)
+            elif dir_type.is_dir():
                 dir_name = dir_type.name
                 
                 # Determine destination
@@ -527,42 +1291,106 @@ class RestoreWorker(QThread):
                 else:
                     dst = Path(self.home) / dir_name
                 
-                self.progress.emit(f"Restoring {dir_name} to {dst}...")
-                dst.parent.mkdir(parents=True, exist_ok=True)
+                self._emit(f"Restoring {dir_name} to {dst}...")
+                self._ensure_dir(dst.parent)
                 
-                # Merge directories
-                for item in dir_type.rglob('*'):
-                    if item.is_file():
-                        rel_path = item.relative_to(dir_type)
-                        dst_file = dst / rel_path
-                        dst_file.parent.mkdir(parents=True, exist_ok=True)
-                        shutil.copyfile(item, dst_file)
-    
-    def get_xdg_user_dirs(self):
-        """Get XDG user directories"""
-        dirs = {}
-        config_file = Path(self.home) / ".config/user-dirs.dirs"
+                # Merge directories; rsync never deletes files missing from the backup
+                if not _rsync_tree(dir_type, dst, self._emit, links=True):
+                    self._merge_tree(dir_type, dst)
+
+
+class ListBackupsWorker(QThread):
+    """Worker thread that scans a backup location for the restore list"""
+    found = pyqtSignal(list)
+    
+    def __init__(self, base_path, meta_cache, index_file):
+        super().__init__()
+        self.base_path = base_path
+        # Shared with the GUI; only this thread touches it while running
+        self.meta_cache = meta_cache
+        self.index_file = index_file
+        self._dirty = False
+    
+    def run(self):
+        # Find backup directories with one scandir, then read their metadata
+        # concurrently so NAS round-trips overlap
+        try:
+            with os.scandir(self.base_path) as it:
+                candidates = [(entry.path, entry.name) for entry in it
+                              if entry.is_dir(follow_symlinks=False)]
+        except OSError:
+            candidates = []
         
-        if config_file.exists():
-            with open(config_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line.startswith('XDG_') and '=' in line:
-                        key, value = line.split('=', 1)
-                        value = value.strip('"').replace('$HOME', self.home)
-                        
-                        if 'DOCUMENTS' in key:
-                            dirs['Documents'] = value
-                        elif 'PICTURES' in key:
-                            dirs['Pictures'] = value
-                        elif 'VIDEOS' in key:
-                            dirs['Videos'] = value
-                        elif 'MUSIC' in key:
-                            dirs['Music'] = value
-                        elif 'DOWNLOAD' in key:
-                            dirs['Downloads'] = value
-        
-        return dirs
+        backups = []
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+            futures = [executor.submit(self._load_backup_meta, path, name)
+                       for path, name in candidates]
+            for future in as_completed(futures):
+                backup = future.result()
+                if backup is not None:
+                    backups.append(backup)
+        seen = {backup['path'] for backup in backups}
+        
+        # Forget backups that were deleted from this location
+        base = str(self.base_path)
+        for key in [k for k in self.meta_cache if k not in seen and os.path.dirname(k) == base]:
+            del self.meta_cache[key]
+            self._dirty = True
+        
+        # Sort by timestamp
+        backups.sort(key=operator.itemgetter('sort_key'), reverse=True)
+        self.found.emit(backups)
+        
+        if self._dirty:
+            self._save_index()
+    
+    def _save_index(self):
+        """Write the metadata index so the next launch can skip unchanged backups"""
+        try:
+            self.index_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.index_file.with_suffix(".tmp")
+            tmp_file.write_bytes(_dumps(self.meta_cache))
+            os.replace(tmp_file, self.index_file)
+        except OSError:
+            pass  # The index is only a cache
+    
+    def _load_backup_meta(self, path, name):
+        """Describe one backup directory for the list, or None if it has no metadata"""
+        # Open the metadata directly instead of checking for it first; backups
+        # made before summary.json existed only have backup_metadata.json
+        try:
+            metadata_file = open(os.path.join(path, "summary.json"), 'rb')
+        except OSError:
+            try:
+                metadata_file = open(os.path.join(path, "backup_metadata.json"), 'rb')
+            except OSError:
+                return None
+        
+        try:
+            with metadata_file:
+                # Only re-parse metadata that changed since it was last indexed
+                st = os.fstat(metadata_file.fileno())
+                cached = self.meta_cache.get(path)
+                if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                    timestamp, hostname = cached[2], cached[3]
+                else:
+                    metadata = _loads(metadata_file.read())
+                    timestamp = metadata.get('timestamp', name)
+                    hostname = metadata.get('hostname', 'Unknown')
+                    self.meta_cache[path] = [st.st_mtime_ns, st.st_size, timestamp, hostname]
+                    self._dirty = True
+            
+            return {
+                'path': path,
+                'display': f"{timestamp} - {hostname}",
+                'sort_key': _backup_sort_key(timestamp)
+            }
+        except:
+            return {
+                'path': path,
+                'display': name,
+                'sort_key': _backup_sort_key(name)
+            }
 
 
 class BackupManagerGUI(QMainWindow):
@@ -587,6 +1415,16 @@ class BackupManagerGUI(QMainWindow):
         
         self.backup_path = str(Path(self.default_backup_base) / self.hostname)
         
+        # Indexed backup_metadata.json per backup dir, kept across launches:
+        # path -> [mtime_ns, size, timestamp, hostname]
+        self._index_file = Path.home() / ".cache" / "plasma-backup-manager" / "index.json"
+        self._meta_cache = self.load_backup_index()
+        self._list_worker = None
+        self._relist = False
+        
+        # Read once; the settings tab only displays it
+        self._os_release = _read_os_release()
+        
         self.init_ui()
     
     def load_backup_config(self):
@@ -594,13 +1432,22 @@ class BackupManagerGUI(QMainWindow):
         config_file = Path.home() / ".config" / "plasma-backup-manager" / "config.json"
         if config_file.exists():
             try:
-                with open(config_file, 'r') as f:
-                    config = json.load(f)
-                    if 'backup_base_path' in config:
-                        self.default_backup_base = config['backup_base_path']
+                config = _loads(config_file.read_bytes())
+                if 'backup_base_path' in config:
+                    self.default_backup_base = config['backup_base_path']
             except:
                 pass  # Use default if config can't be read
         
+    def load_backup_index(self):
+        """Load the backup metadata index from the last session"""
+        try:
+            index = _loads(self._index_file.read_bytes())
+            if isinstance(index, dict):
+                return index
+        except:
+            pass  # Rebuild the index if it can't be read
+        return {}
+        
     def init_ui(self):
         """Initialize the user interface"""
         central_widget = QWidget()
@@ -682,6 +1529,19 @@ class BackupManagerGUI(QMainWindow):
         self.user_dirs_cb.setChecked(True)
         options_layout.addWidget(self.user_dirs_cb)
         
+        self.compress_cb = QCheckBox("Compress profiles and user directories (tar.zst)")
+        if zstandard is None:
+            self.compress_cb.setEnabled(False)
+            self.compress_cb.setToolTip("Requires python-zstandard")
+        options_layout.addWidget(self.compress_cb)
+        
+        exclude_layout = QHBoxLayout()
+        exclude_layout.addWidget(QLabel("Skip folders named:"))
+        self.excludes_edit = QLineEdit(", ".join(DEFAULT_EXCLUDES))
+        self.excludes_edit.setToolTip("Comma-separated folder names left out of browser profiles and application configs")
+        exclude_layout.addWidget(self.excludes_edit)
+        options_layout.addLayout(exclude_layout)
+        
         options_group.setLayout(options_layout)
         layout.addWidget(options_group)
         
@@ -723,13 +1583,24 @@ class BackupManagerGUI(QMainWindow):
         selection_layout.addLayout(path_layout)
         
         # List available backups
-        list_btn = QPushButton("List Available Backups")
-        list_btn.clicked.connect(self.list_backups)
-        selection_layout.addWidget(list_btn)
-        
-        self.backup_list = QListWidget()
-        self.backup_list.itemDoubleClicked.connect(self.select_backup_from_list)
-        selection_layout.addWidget(self.backup_list)
+        self.list_btn = QPushButton("List Available Backups")
+        self.list_btn.clicked.connect(lambda: self.list_backups())
+        selection_layout.addWidget(self.list_btn)
+        
+        self.backup_model = QStandardItemModel(self)
+        self.backup_view = QListView()
+        self.backup_view.setModel(self.backup_model)
+        self.backup_view.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+        self.backup_view.doubleClicked.connect(self.select_backup_from_list)
+        selection_layout.addWidget(self.backup_view)
+        
+        # Re-list once the backup location has stopped changing for 200 ms,
+        # not on every keystroke
+        self._list_timer = QTimer(self)
+        self._list_timer.setSingleShot(True)
+        self._list_timer.setInterval(200)
+        self._list_timer.timeout.connect(lambda: self.list_backups(silent=True))
+        self.backup_path_edit.textChanged.connect(lambda text: self._list_timer.start())
         
         selection_group.setLayout(selection_layout)
         layout.addWidget(selection_group)
@@ -770,20 +1641,8 @@ class BackupManagerGUI(QMainWindow):
         info_layout.addWidget(QLabel(f"User: {os.getenv('USER')}"))
         info_layout.addWidget(QLabel(f"Home: {Path.home()}"))
         
-        try:
-            result = subprocess.run(['plasmashell', '--version'], 
-                                  capture_output=True, text=True)
-            kde_version = result.stdout.strip()
-        except:
-            kde_version = "Unknown"
-        info_layout.addWidget(QLabel(f"KDE: {kde_version}"))
-        
-        try:
-            with open('/etc/fedora-release', 'r') as f:
-                fedora_version = f.read().strip()
-        except:
-            fedora_version = "Unknown"
-        info_layout.addWidget(QLabel(f"OS: {fedora_version}"))
+        info_layout.addWidget(QLabel(f"KDE: {_kde_version()}"))
+        info_layout.addWidget(QLabel(f"OS: {self._os_release}"))
         
         info_group.setLayout(info_layout)
         layout.addWidget(info_group)
@@ -1117,56 +1976,61 @@ WantedBy=timers.target
         if path:
             self.restore_path_edit.setText(path)
     
-    def list_backups(self):
-        """List available backups"""
-        self.backup_list.clear()
-        
+    def list_backups(self, silent=False):
+        """List available backups (silent: no dialog for a missing location)"""
         base_path = Path(self.backup_path_edit.text() or self.backup_path)
         
         if not base_path.exists():
-            QMessageBox.warning(
-                self, "Path Not Found",
-                f"Backup location does not exist:\n{base_path}"
-            )
+            self.backup_model.clear()
+            # Drop the results of a scan of the previous location
+            if self._list_worker is not None and self._list_worker.isRunning():
+                self._relist = True
+            if not silent:
+                QMessageBox.warning(
+                    self, "Path Not Found",
+                    f"Backup location does not exist:\n{base_path}"
+                )
             return
         
-        # Find backup directories
-        backups = []
-        for item in base_path.iterdir():
-            if item.is_dir():
-                metadata_file = item / "backup_metadata.json"
-                if metadata_file.exists():
-                    try:
-                        with open(metadata_file, 'r') as f:
-                            metadata = json.load(f)
-                        
-                        timestamp = metadata.get('timestamp', item.name)
-                        hostname = metadata.get('hostname', 'Unknown')
-                        
-                        backups.append({
-                            'path': str(item),
-                            'display': f"{timestamp} - {hostname}",
-                            'timestamp': timestamp
-                        })
-                    except:
-                        backups.append({
-                            'path': str(item),
-                            'display': item.name,
-                            'timestamp': item.name
-                        })
+        # Scan on a worker thread so a slow mount can't freeze the window
+        if self._list_worker is not None and self._list_worker.isRunning():
+            self._relist = True
+            return
         
-        # Sort by timestamp
-        backups.sort(key=lambda x: x['timestamp'], reverse=True)
+        self.list_btn.setEnabled(False)
+        self._list_worker = ListBackupsWorker(base_path, self._meta_cache, self._index_file)
+        self._list_worker.found.connect(self._show_backups)
+        self._list_worker.finished.connect(self._list_finished)
+        self._list_worker.start()
+    
+    def _list_finished(self):
+        """Re-enable listing, rescanning if the location changed meanwhile"""
+        self.list_btn.setEnabled(True)
+        if self._relist:
+            self._relist = False
+            self.list_backups(silent=True)
+    
+    def _show_backups(self, backups):
+        """Fill the backup list with the worker's results"""
+        if self._relist:
+            return
         
+        # Build the rows first, keeping each row's path alongside it for selection
+        role = Qt.ItemDataRole.UserRole
+        items = []
         for backup in backups:
-            self.backup_list.addItem(f"{backup['display']}\n  → {backup['path']}")
+            item = QStandardItem(f"{backup['display']}\n  → {backup['path']}")
+            item.setData(backup['path'], role)
+            items.append(item)
+        
+        # Swap the rows in one batch: a reset, then a single insert
+        self.backup_model.clear()
+        self.backup_model.invisibleRootItem().appendRows(items)
     
-    def select_backup_from_list(self, item):
+    def select_backup_from_list(self, index):
         """Select a backup from the list"""
-        text = item.text()
-        # Extract path from the display text
-        if '→' in text:
-            path = text.split('→')[1].strip()
+        path = index.data(Qt.ItemDataRole.UserRole)
+        if path:
             self.restore_path_edit.setText(path)
     
     def start_backup(self):
@@ -1178,6 +2042,8 @@ WantedBy=timers.target
             'firefox': self.firefox_cb.isChecked(),
             'thunderbird': self.thunderbird_cb.isChecked(),
             'user_dirs': self.user_dirs_cb.isChecked(),
+            'compress': self.compress_cb.isChecked(),
+            'excludes': [name.strip() for name in self.excludes_edit.text().split(',') if name.strip()],
         }
         
         backup_path = self.backup_path_edit.text()
@@ -1207,9 +2073,11 @@ WantedBy=timers.target
         self.backup_worker.start()
     
     def update_backup_progress(self, message):
-        """Update backup progress display"""
-        self.backup_progress.append(message)
-        self.statusBar().showMessage(message)
+        """Update backup progress display with a batch of lines"""
+        self.backup_progress.moveCursor(QTextCursor.MoveOperation.End)
+        self.backup_progress.insertPlainText(message + '\n')
+        self.backup_progress.ensureCursorVisible()
+        self.statusBar().showMessage(message.rstrip('\n').rsplit('\n', 1)[-1])
     
     def backup_finished(self, success, message):
         """Handle backup completion"""
@@ -1294,9 +2162,11 @@ WantedBy=timers.target
         self.restore_worker.start()
     
     def update_restore_progress(self, message):
-        """Update restore progress display"""
-        self.restore_progress.append(message)
-        self.statusBar().showMessage(message)
+        """Update restore progress display with a batch of lines"""
+        self.restore_progress.moveCursor(QTextCursor.MoveOperation.End)
+        self.restore_progress.insertPlainText(message + '\n')
+        self.restore_progress.ensureCursorVisible()
+        self.statusBar().showMessage(message.rstrip('\n').rsplit('\n', 1)[-1])
     
     def restore_finished(self, success, message):
         """Handle restore completion"""